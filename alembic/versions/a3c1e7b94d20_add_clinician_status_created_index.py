@@ -0,0 +1,27 @@
+"""add_clinician_status_created_index
+
+Revision ID: a3c1e7b94d20
+Revises: f82689de3fdd
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op  # type: ignore[attr-defined]
+
+# revision identifiers, used by Alembic.
+revision: str = "a3c1e7b94d20"
+down_revision: str | Sequence[str] | None = "f82689de3fdd"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema - Add composite index for listing a clinician's recordings."""
+    op.create_index("ix_recordings_clinician_status_created", "recordings", ["clinician_id", "status", "created_at"])
+
+
+def downgrade() -> None:
+    """Downgrade schema - Remove composite index for listing a clinician's recordings."""
+    op.drop_index("ix_recordings_clinician_status_created", table_name="recordings")
@@ -1,3 +1,5 @@
+import atexit
+
 import httpx
 import typer
 from rich.console import Console
@@ -6,6 +8,21 @@ app = typer.Typer(help="Interface handle for the Clinical Guardrails API.")
 console = Console()
 API_BASE = "http://localhost:8000"
 
+_client: httpx.Client | None = None
+
+
+def _get_client() -> httpx.Client:
+    """Return the shared keep-alive HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.Client(
+            base_url=API_BASE,
+            timeout=20.0,
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30),
+        )
+        atexit.register(_client.close)
+    return _client
+
 
 @app.command()
 def verify_integrated(
@@ -18,7 +35,7 @@ def verify_integrated(
     payload = {"ai_output": {"summary_text": text, "extracted_dates": extracted_dates}}
 
     try:
-        response = httpx.post(f"{API_BASE}/verify/fhir/{id}", json=payload, timeout=20.0)
+        response = _get_client().post(f"/verify/fhir/{id}", json=payload)
         _print_verification(response)
     except Exception as e:
         console.print(f"[red]❌ API Error:[/red] {str(e)}")
@@ -28,7 +45,7 @@ def verify_integrated(
 def stats() -> None:
     """Check current compliance session statistics from the API."""
     try:
-        response = httpx.get(f"{API_BASE}/stats")
+        response = _get_client().get("/stats", timeout=5.0)
         console.print_json(data=response.json())
     except Exception as e:
         console.print(f"[red]❌ API Error:[/red] {str(e)}")
@@ -3,6 +3,22 @@ import asyncio
 import click
 
 from src.integrations.fhir.client import FHIRClient
+from src.models import EMRContext, PatientProfile
+
+
+def _print_patient(profile: PatientProfile, context: EMRContext | BaseException) -> None:
+    """Print a patient's domain profile and latest visit, or why the visit is unavailable."""
+    click.secho(
+        f"✅ Domain Profile: {profile.first_name} {profile.last_name} (DOB: {profile.dob})",
+        fg="green",
+    )
+    if isinstance(context, BaseException):
+        click.secho(f"⚠️ Encounter Note: {str(context)}", fg="yellow")
+    else:
+        click.secho(
+            f"✅ Latest Visit: {context.visit_id} (Admitted: {context.admission_date})",
+            fg="green",
+        )
 
 
 @click.group()
@@ -21,19 +37,44 @@ def inspect(patient_id: str) -> None:
         try:
             click.echo(f"🔍 [FHIR] Fetching Patient {patient_id}...")
             profile = await client.get_patient_profile(patient_id)
-            click.secho(
-                f"✅ Domain Profile: {profile.first_name} {profile.last_name} (DOB: {profile.dob})",
-                fg="green",
-            )
 
+            context: EMRContext | BaseException
             try:
                 context = await client.get_latest_encounter(patient_id)
-                click.secho(
-                    f"✅ Latest Visit: {context.visit_id} (Admitted: {context.admission_date})",
-                    fg="green",
-                )
             except Exception as e:
-                click.secho(f"⚠️ Encounter Note: {str(e)}", fg="yellow")
+                context = e
+            _print_patient(profile, context)
+        finally:
+            await client.close()
+
+    asyncio.run(_run())
+
+
+@cli.command()
+@click.argument("patient_ids", nargs=-1, required=True)
+def inspect_many(patient_ids: tuple[str, ...]) -> None:
+    """Inspect several patients concurrently over one pooled FHIR connection."""
+
+    async def _run() -> None:
+        client = FHIRClient()
+        try:
+            click.echo(f"🔍 [FHIR] Fetching {len(patient_ids)} patients...")
+            results = await asyncio.gather(
+                *(
+                    asyncio.gather(
+                        client.get_patient_profile(pid),
+                        client.get_latest_encounter(pid),
+                        return_exceptions=True,
+                    )
+                    for pid in patient_ids
+                )
+            )
+
+            for pid, (profile, context) in zip(patient_ids, results, strict=True):
+                if isinstance(profile, BaseException):
+                    click.secho(f"❌ Patient {pid}: {str(profile)}", fg="red")
+                    continue
+                _print_patient(profile, context)
         finally:
             await client.close()
 
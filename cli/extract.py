@@ -16,12 +16,14 @@ from rich.json import JSON
 from rich.panel import Panel
 from rich.table import Table
 
-from src.extraction import LLMTranscriptParser, SyntheticLLMClient
 from src.extraction.models import StructuredExtraction
 
 app = typer.Typer(help="Extract structured data from clinical transcripts using LLM.")
 console = Console()
 
+DEFAULT_BATCH_CONCURRENCY = 4
+SAMPLE_TRANSCRIPTS_PATH = Path("tests/fixtures/sample_transcripts.json")
+
 
 def _check_api_key() -> str | None:
     """Check if SYNTHETIC_API_KEY is available."""
@@ -30,6 +32,36 @@ def _check_api_key() -> str | None:
     return os.environ.get("SYNTHETIC_API_KEY")
 
 
+def _require_api_key() -> str:
+    """Return SYNTHETIC_API_KEY, or explain how to set it and exit."""
+    api_key = _check_api_key()
+    if not api_key:
+        console.print(
+            Panel(
+                "[red]SYNTHETIC_API_KEY not found![/red]\n\n"
+                "Set it via environment variable:\n"
+                "  export SYNTHETIC_API_KEY=your_key\n\n"
+                "Or create .env.secrets file:\n"
+                "  SYNTHETIC_API_KEY=your_key",
+                title="API Key Required",
+                border_style="red",
+            )
+        )
+        raise typer.Exit(1)
+    return api_key
+
+
+def _load_samples() -> list[dict[str, Any]]:
+    """Load the built-in sample transcripts, exiting if the fixture file is missing."""
+    if not SAMPLE_TRANSCRIPTS_PATH.exists():
+        console.print("[red]❌ Error:[/red] Sample transcripts not found")
+        raise typer.Exit(1)
+
+    data = json.loads(SAMPLE_TRANSCRIPTS_PATH.read_bytes())
+    transcripts: list[dict[str, Any]] = data.get("transcripts", [])
+    return transcripts
+
+
 @app.command()
 def extract(
     text: str | None = typer.Option(None, "--text", "-t", help="Transcript text to extract from"),  # noqa: B008
@@ -40,11 +72,11 @@ def extract(
         "-d",
         help="Reference date for temporal expressions (YYYY-MM-DD). Defaults to today.",
     ),
-    model: str = typer.Option(  # noqa: B008
-        "hf:nvidia/Kimi-K2.5-NVFP4",
+    model: str | None = typer.Option(  # noqa: B008
+        None,
         "--model",
         "-m",
-        help="Model ID to use for extraction",
+        help="Model ID to use for extraction. Defaults to the Synthetic client's default model.",
     ),
     output: Path | None = typer.Option(None, "--output", "-o", help="Output file path (JSON)"),  # noqa: B008
     pretty: bool = typer.Option(True, "--pretty/--no-pretty", help="Pretty print output"),  # noqa: B008
@@ -74,27 +106,14 @@ def extract(
         raise typer.Exit(1)
 
     # Check API key
-    api_key = _check_api_key()
-    if not api_key:
-        console.print(
-            Panel(
-                "[red]SYNTHETIC_API_KEY not found![/red]\n\n"
-                "Set it via environment variable:\n"
-                "  export SYNTHETIC_API_KEY=your_key\n\n"
-                "Or create .env.secrets file:\n"
-                "  SYNTHETIC_API_KEY=your_key",
-                title="API Key Required",
-                border_style="red",
-            )
-        )
-        raise typer.Exit(1)
+    api_key = _require_api_key()
 
     # Read transcript
     if file:
         if not file.exists():
             console.print(f"[red]❌ Error:[/red] File not found: {file}")
             raise typer.Exit(1)
-        transcript_text = file.read_text()
+        transcript_text = file.read_text(encoding="utf-8")
     elif text:
         transcript_text = text
     else:
@@ -118,25 +137,66 @@ def extract(
         raise typer.Exit(1) from None
 
     # Output results
-    result_dict = _extraction_to_dict(result)
-
     if output:
-        output.write_text(json.dumps(result_dict, indent=2))
+        output.write_text(json.dumps(_extraction_to_dict(result), indent=2), encoding="utf-8")
         console.print(f"[green]✅ Results saved to:[/green] {output}")
     else:
-        _print_extraction_result(result, result_dict, pretty)
+        _print_extraction_result(result, pretty)
 
 
 async def _extract_async(
     text: str,
     reference_date: date | None,
-    model: str,
+    model: str | None,
     api_key: str,
 ) -> StructuredExtraction:
     """Async extraction wrapper."""
+    results = await _extract_batch_async([text], reference_date, model, api_key)
+    return results[0]
+
+
+async def _extract_batch_async(
+    texts: list[str],
+    reference_date: date | None,
+    model: str | None,
+    api_key: str,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> list[StructuredExtraction]:
+    """Extract several transcripts over one shared LLM client session.
+
+    At most ``concurrency`` requests are in flight at once, so a long index list
+    does not hit the LLM API with every transcript simultaneously.
+    """
+    # Imported here rather than at module level: the LLM clients load the openai SDK,
+    # which would otherwise dominate startup for --help, list-samples and error exits.
+    from src.extraction import LLMTranscriptParser, SyntheticLLMClient
+
+    semaphore = asyncio.Semaphore(concurrency)
+
     async with SyntheticLLMClient(api_key=api_key, model=model) as client:
         parser = LLMTranscriptParser(llm_client=client, reference_date=reference_date)
-        return await parser.parse(text)
+
+        async def parse(text: str) -> StructuredExtraction:
+            async with semaphore:
+                return await parser.parse(text)
+
+        return list(await asyncio.gather(*(parse(t) for t in texts)))
+
+
+_CONFIDENCE_COLORS = ("red", "yellow", "green")
+
+
+def _conf_color(confidence: float) -> str:
+    """Rich color for a confidence score: green >= 0.8, yellow >= 0.5, else red."""
+    return _CONFIDENCE_COLORS[(confidence >= 0.5) + (confidence >= 0.8)]
+
+
+def _new_table(*columns: str) -> Table:
+    """Create a result table with the standard header style."""
+    table = Table(show_header=True, header_style="bold magenta")
+    for column in columns:
+        table.add_column(column)
+    return table
 
 
 def _extraction_to_dict(result: StructuredExtraction) -> dict[str, Any]:
@@ -180,14 +240,48 @@ def _extraction_to_dict(result: StructuredExtraction) -> dict[str, Any]:
     }
 
 
-def _print_extraction_result(
-    result: StructuredExtraction,
-    result_dict: dict[str, Any],
-    pretty: bool,
-) -> None:
+def _build_tables(result: StructuredExtraction) -> tuple[Table, Table, Table]:
+    """Build the medications, diagnoses and temporal expressions tables for display."""
+    medications = _new_table("Name", "Dosage", "Frequency", "Status", "Confidence")
+    for med in result.medications:
+        conf_color = _conf_color(med.confidence)
+        medications.add_row(
+            med.name,
+            med.dosage or "-",
+            med.frequency or "-",
+            med.status.value,
+            f"[{conf_color}]{med.confidence:.2f}[/{conf_color}]",
+        )
+
+    diagnoses = _new_table("Condition", "ICD-10", "Confidence")
+    for diag in result.diagnoses:
+        conf_color = _conf_color(diag.confidence)
+        diagnoses.add_row(
+            diag.text,
+            diag.icd10_code or "-",
+            f"[{conf_color}]{diag.confidence:.2f}[/{conf_color}]",
+        )
+
+    temporal_expressions = _new_table("Text", "Type", "Normalized Date", "Confidence")
+    for temp in result.temporal_expressions:
+        conf_color = _conf_color(temp.confidence)
+        temporal_expressions.add_row(
+            temp.text,
+            temp.type.value,
+            temp.normalized_date.isoformat() if temp.normalized_date else "-",
+            f"[{conf_color}]{temp.confidence:.2f}[/{conf_color}]",
+        )
+
+    return medications, diagnoses, temporal_expressions
+
+
+def _print_extraction_result(result: StructuredExtraction, pretty: bool) -> None:
     """Pretty print extraction result."""
+    result_dict = _extraction_to_dict(result)
+    medications, diagnoses, temporal_expressions = _build_tables(result)
+
     # Header
-    confidence_color = "green" if result.confidence >= 0.8 else "yellow" if result.confidence >= 0.5 else "red"
+    confidence_color = _conf_color(result.confidence)
     console.print(
         Panel(
             f"[bold]Extraction Complete[/bold]\n"
@@ -207,59 +301,17 @@ def _print_extraction_result(
     # Medications table
     if result.medications:
         console.print("\n[bold]Medications:[/bold]")
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Name")
-        table.add_column("Dosage")
-        table.add_column("Frequency")
-        table.add_column("Status")
-        table.add_column("Confidence")
-
-        for med in result.medications:
-            conf_color = "green" if med.confidence >= 0.8 else "yellow" if med.confidence >= 0.5 else "red"
-            table.add_row(
-                med.name,
-                med.dosage or "-",
-                med.frequency or "-",
-                med.status.value,
-                f"[{conf_color}]{med.confidence:.2f}[/{conf_color}]",
-            )
-        console.print(table)
+        console.print(medications)
 
     # Diagnoses table
     if result.diagnoses:
         console.print("\n[bold]Diagnoses:[/bold]")
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Condition")
-        table.add_column("ICD-10")
-        table.add_column("Confidence")
-
-        for diag in result.diagnoses:
-            conf_color = "green" if diag.confidence >= 0.8 else "yellow" if diag.confidence >= 0.5 else "red"
-            table.add_row(
-                diag.text,
-                diag.icd10_code or "-",
-                f"[{conf_color}]{diag.confidence:.2f}[/{conf_color}]",
-            )
-        console.print(table)
+        console.print(diagnoses)
 
     # Temporal expressions
     if result.temporal_expressions:
         console.print("\n[bold]Temporal Expressions:[/bold]")
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Text")
-        table.add_column("Type")
-        table.add_column("Normalized Date")
-        table.add_column("Confidence")
-
-        for temp in result.temporal_expressions:
-            conf_color = "green" if temp.confidence >= 0.8 else "yellow" if temp.confidence >= 0.5 else "red"
-            table.add_row(
-                temp.text,
-                temp.type.value,
-                temp.normalized_date.isoformat() if temp.normalized_date else "-",
-                f"[{conf_color}]{temp.confidence:.2f}[/{conf_color}]",
-            )
-        console.print(table)
+        console.print(temporal_expressions)
 
     # Vital signs
     if result.vital_signs:
@@ -268,13 +320,14 @@ def _print_extraction_result(
             console.print(f"  • {vs.get('type', 'unknown')}: {vs.get('value', '-')}")
 
     # Warnings
-    if result.has_low_confidence_extractions():
+    if result_dict["has_low_confidence"]:
         console.print("\n[yellow]⚠️  Warning: Some extractions have low confidence and should be reviewed.[/yellow]")
 
     # Raw JSON
     if pretty:
         console.print("\n[bold]Raw JSON Output:[/bold]")
-        console.print(JSON(json.dumps(result_dict, indent=2)))
+        # from_data serializes once; JSON(str) would re-parse and re-dump the text
+        console.print(JSON.from_data(result_dict, indent=2))
 
 
 @app.command()
@@ -291,16 +344,7 @@ def test(
         # Test with specific sample
         python cli/extract.py test --index 3
     """
-    import json as json_mod
-
-    # Load sample transcripts
-    fixtures_path = Path("tests/fixtures/sample_transcripts.json")
-    if not fixtures_path.exists():
-        console.print("[red]❌ Error:[/red] Sample transcripts not found")
-        raise typer.Exit(1)
-
-    data = json_mod.loads(fixtures_path.read_text())
-    transcripts = data.get("transcripts", [])
+    transcripts = _load_samples()
 
     if index < 0 or index >= len(transcripts):
         console.print(f"[red]❌ Error:[/red] Invalid index. Use 0-{len(transcripts) - 1}")
@@ -313,43 +357,64 @@ def test(
     console.print(f"\n[bold]Transcript:[/bold]\n{sample['text']}\n")
 
     # Run extraction on this sample
-    api_key = _check_api_key()
-    if not api_key:
-        console.print(
-            Panel(
-                "[red]SYNTHETIC_API_KEY not found![/red]\n\n"
-                "Set it via environment variable:\n"
-                "  export SYNTHETIC_API_KEY=your_key\n\n"
-                "Or create .env.secrets file:\n"
-                "  SYNTHETIC_API_KEY=your_key",
-                title="API Key Required",
-                border_style="red",
-            )
-        )
-        raise typer.Exit(1)
+    api_key = _require_api_key()
 
     try:
-        result = asyncio.run(_extract_async(sample["text"], None, "hf:nvidia/Kimi-K2.5-NVFP4", api_key))
+        result = asyncio.run(_extract_async(sample["text"], None, None, api_key))
     except Exception as e:
         console.print(f"[red]❌ Extraction failed:[/red] {str(e)}")
         raise typer.Exit(1) from None
 
-    result_dict = _extraction_to_dict(result)
-    _print_extraction_result(result, result_dict, pretty)
+    _print_extraction_result(result, pretty)
 
 
 @app.command()
-def list_samples() -> None:
-    """List available sample transcripts."""
-    import json as json_mod
+def test_batch(
+    indices: str = typer.Option("0,1,2", "--indices", "-i", help="Comma-separated sample transcript indices"),
+    concurrency: int = typer.Option(
+        DEFAULT_BATCH_CONCURRENCY, "--concurrency", "-c", min=1, help="Maximum concurrent extraction requests"
+    ),
+    pretty: bool = typer.Option(False, "--pretty/--no-pretty", help="Pretty print raw JSON output"),
+) -> None:
+    """Extract from several built-in sample transcripts in one concurrent batch.
 
-    fixtures_path = Path("tests/fixtures/sample_transcripts.json")
-    if not fixtures_path.exists():
-        console.print("[red]❌ Error:[/red] Sample transcripts not found")
+    Examples:
+        # Test the first four samples together
+        python cli/extract.py test-batch --indices 0,1,2,3
+
+        # At most two requests in flight
+        python cli/extract.py test-batch --indices 0,1,2,3 --concurrency 2
+    """
+    transcripts = _load_samples()
+
+    try:
+        selected = [int(i) for i in indices.split(",") if i.strip()]
+    except ValueError:
+        console.print(f"[red]❌ Error:[/red] Invalid indices: {indices}")
+        raise typer.Exit(1) from None
+
+    if not selected or any(i < 0 or i >= len(transcripts) for i in selected):
+        console.print(f"[red]❌ Error:[/red] Invalid index. Use 0-{len(transcripts) - 1}")
         raise typer.Exit(1)
 
-    data = json_mod.loads(fixtures_path.read_text())
-    transcripts = data.get("transcripts", [])
+    api_key = _require_api_key()
+
+    samples = [transcripts[i] for i in selected]
+    try:
+        results = asyncio.run(_extract_batch_async([s["text"] for s in samples], None, None, api_key, concurrency))
+    except Exception as e:
+        console.print(f"[red]❌ Extraction failed:[/red] {str(e)}")
+        raise typer.Exit(1) from None
+
+    for index, sample, result in zip(selected, samples, results, strict=True):
+        console.print(f"\n[bold]Sample {index}:[/bold] {sample['id']}")
+        _print_extraction_result(result, pretty)
+
+
+@app.command()
+def list_samples() -> None:
+    """List available sample transcripts."""
+    transcripts = _load_samples()
 
     console.print(f"\n[bold]Available Sample Transcripts ({len(transcripts)} total):[/bold]\n")
 
@@ -2,6 +2,7 @@
 """CLI tool for managing and testing medical protocol rules."""
 
 import argparse
+import re
 import sys
 from pathlib import Path
 
@@ -15,6 +16,15 @@ from src.models import PatientProfile
 from src.protocols.config import load_protocol_config
 from src.protocols.registry import ProtocolRegistry
 
+_LIST_SEPARATOR = re.compile(r"\s*,\s*")
+
+
+def _split_list(value: str | None) -> list[str]:
+    """Split a comma-separated option value, trimming whitespace and dropping empty items."""
+    if not value:
+        return []
+    return [item for item in _LIST_SEPARATOR.split(value.strip()) if item]
+
 
 def validate_config(args: argparse.Namespace) -> None:
     """Validate configuration file syntax."""
@@ -74,33 +84,38 @@ def check_transcript(args: argparse.Namespace) -> None:
 
     registry = ProtocolRegistry(config)
 
-    # Create sample patient
-    patient = PatientProfile(
-        patient_id=args.patient_id or "CLI-PATIENT",
-        first_name="Test",
-        last_name="Patient",
-        dob=date(1990, 1, 1),
-        allergies=args.allergies.split(",") if args.allergies else [],
-        diagnoses=[],
-    )
-
     # Create extraction from medications list
-    medications = [ExtractedMedication(name=m.strip()) for m in args.medications.split(",")] if args.medications else []
+    medications = [ExtractedMedication(name=name) for name in _split_list(args.medications)]
     extraction = StructuredExtraction(medications=medications)
+    allergies = _split_list(args.allergies)
+
+    # Multiple comma-separated patient IDs share one config load and registry
+    patient_ids = _split_list(args.patient_id)
+
+    for patient_id in patient_ids or ["CLI-PATIENT"]:
+        # Create sample patient
+        patient = PatientProfile(
+            patient_id=patient_id,
+            first_name="Test",
+            last_name="Patient",
+            dob=date(1990, 1, 1),
+            allergies=allergies,
+            diagnoses=[],
+        )
 
-    print(f"Checking patient: {patient.patient_id}")
-    print(f"Allergies: {patient.allergies}")
-    print(f"Medications: {[m.name for m in medications]}")
-    print("-" * 60)
+        print(f"Checking patient: {patient.patient_id}")
+        print(f"Allergies: {patient.allergies}")
+        print(f"Medications: {[m.name for m in medications]}")
+        print("-" * 60)
 
-    alerts = registry.check_all(patient, extraction)
+        alerts = registry.check_all(patient, extraction)
 
-    if not alerts:
-        print("✓ No protocol violations detected")
-    else:
-        print(f"⚠ {len(alerts)} protocol violation(s) detected:")
-        for alert in alerts:
-            print(f"  [{alert.severity.value}] {alert.message}")
+        if not alerts:
+            print("✓ No protocol violations detected")
+        else:
+            print(f"⚠ {len(alerts)} protocol violation(s) detected:")
+            for alert in alerts:
+                print(f"  [{alert.severity.value}] {alert.message}")
 
 
 def main() -> None:
@@ -119,7 +134,7 @@ def main() -> None:
 
     # check command
     check_parser = subparsers.add_parser("check", help="Check a transcript against protocols")
-    check_parser.add_argument("--patient-id", help="Patient ID")
+    check_parser.add_argument("--patient-id", help="Patient ID (comma-separated for several patients)")
     check_parser.add_argument("--allergies", help="Comma-separated list of allergies")
     check_parser.add_argument("--medications", help="Comma-separated list of medications")
     check_parser.set_defaults(func=check_transcript)
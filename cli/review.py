@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """CLI tool for clinical note review workflow."""
 
+import atexit
+import io
 import sys
 from datetime import datetime
 from typing import Any
@@ -14,21 +16,45 @@ console = Console()
 
 API_BASE = "http://localhost:8000"
 
+_EQ = "=" * 80
+_DASH = "-" * 80
+
+# One keep-alive client per API base URL, reused across commands
+_clients: dict[str, httpx.Client] = {}
+
+
+def _get_client(api_url: str) -> httpx.Client:
+    """Return the shared HTTP client for an API base URL, creating it on first use."""
+    client = _clients.get(api_url)
+    if client is None:
+        client = httpx.Client(
+            base_url=api_url,
+            timeout=20.0,
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30),
+        )
+        _clients[api_url] = client
+        atexit.register(client.close)
+    return client
+
 
 def format_review(review_data: dict[str, Any]) -> str:
     """Format review data for display."""
-    lines = []
-    lines.append("=" * 80)
-    lines.append("CLINICAL NOTE REVIEW")
-    lines.append("=" * 80)
-    lines.append("")
+    buf = io.StringIO()
+    w = buf.write
+
+    w(f"{_EQ}\n")
+    w("CLINICAL NOTE REVIEW\n")
+    w(f"{_EQ}\n")
+    w("\n")
 
     # Patient info
     note = review_data.get("note", {})
     emr = review_data.get("emr_context", {})
     patient_id = note.get("patient_id", "Unknown")
     note_id = note.get("note_id", "Unknown")
-    created_at = review_data.get("created_at", datetime.now().isoformat())
+    created_at = review_data.get("created_at")
+    if created_at is None:
+        created_at = datetime.now().isoformat()
 
     # Try to get patient name from EMR context
     patient_name = "Unknown"
@@ -37,89 +63,87 @@ def format_review(review_data: dict[str, Any]) -> str:
         # Try to extract name from raw_notes if available
         patient_name = emr.get("attending_physician", "Patient")
 
-    lines.append(f"Patient: {patient_name} (ID: {patient_id})")
-    lines.append(f"Review ID: {note_id}")
+    w(f"Patient: {patient_name} (ID: {patient_id})\n")
+    w(f"Review ID: {note_id}\n")
     if isinstance(created_at, str):
-        lines.append(f"Created: {created_at}")
+        w(f"Created: {created_at}\n")
     else:
-        lines.append(f"Created: {created_at.strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append("")
+        w(f"Created: {created_at.strftime('%Y-%m-%d %H:%M:%S')}\n")
+    w("\n")
 
     # AI Note sections
-    lines.append("-" * 80)
-    lines.append("AI NOTE SECTIONS")
-    lines.append("-" * 80)
+    w(f"{_DASH}\n")
+    w("AI NOTE SECTIONS\n")
+    w(f"{_DASH}\n")
     sections = note.get("sections", {})
     if sections:
         for section_name, content in sections.items():
-            lines.append(f"  {section_name}: {content}")
-            lines.append("")
+            w(f"  {section_name}: {content}\n\n")
     else:
-        lines.append("  (No sections provided)")
-        lines.append("")
+        w("  (No sections provided)\n\n")
 
     # EMR Context
-    lines.append("-" * 80)
-    lines.append("EMR CONTEXT")
-    lines.append("-" * 80)
+    w(f"{_DASH}\n")
+    w("EMR CONTEXT\n")
+    w(f"{_DASH}\n")
     visit_id = emr.get("visit_id", "Unknown")
     admission_date = emr.get("admission_date", "Unknown")
     discharge_date = emr.get("discharge_date")
     attending = emr.get("attending_physician", "Unknown")
 
-    lines.append(f"  Visit ID: {visit_id}")
+    w(f"  Visit ID: {visit_id}\n")
     if isinstance(admission_date, str):
-        lines.append(f"  Admission: {admission_date}")
+        w(f"  Admission: {admission_date}\n")
     else:
-        lines.append(f"  Admission: {admission_date.strftime('%Y-%m-%d %H:%M') if admission_date else 'Unknown'}")
+        w(f"  Admission: {admission_date.strftime('%Y-%m-%d %H:%M') if admission_date else 'Unknown'}\n")
 
     if discharge_date:
         if isinstance(discharge_date, str):
-            lines.append(f"  Discharge: {discharge_date}")
+            w(f"  Discharge: {discharge_date}\n")
         else:
-            lines.append(f"  Discharge: {discharge_date.strftime('%Y-%m-%d %H:%M')}")
+            w(f"  Discharge: {discharge_date.strftime('%Y-%m-%d %H:%M')}\n")
 
-    lines.append(f"  Physician: {attending}")
-    lines.append("")
+    w(f"  Physician: {attending}\n")
+    w("\n")
 
     # Verification
-    lines.append("-" * 80)
-    lines.append("VERIFICATION RESULTS")
-    lines.append("-" * 80)
+    w(f"{_DASH}\n")
+    w("VERIFICATION RESULTS\n")
+    w(f"{_DASH}\n")
     verification = review_data.get("verification", {})
     if verification:
         is_safe = verification.get("is_safe_to_file", False)
         status = "VERIFIED" if is_safe else "REJECTED"
         score = verification.get("score", 0.0)
 
-        lines.append(f"  Status: {status}")
-        lines.append(f"  Confidence: {score:.2f}")
-        lines.append("")
+        w(f"  Status: {status}\n")
+        w(f"  Confidence: {score:.2f}\n")
+        w("\n")
 
         alerts = verification.get("alerts", [])
         if alerts:
-            lines.append("  Alerts:")
+            w("  Alerts:\n")
             for alert in alerts:
                 severity = alert.get("severity", "UNKNOWN").upper()
                 message = alert.get("message", "No message")
-                lines.append(f"    [{severity}] {message}")
+                w(f"    [{severity}] {message}\n")
         else:
-            lines.append("  Alerts: None")
+            w("  Alerts: None\n")
 
-        lines.append("")
+        w("\n")
 
         # Discrepancies section
-        lines.append("  Discrepancies: None")
+        w("  Discrepancies: None\n")
     else:
-        lines.append("  Status: ERROR - Verification failed")
+        w("  Status: ERROR - Verification failed\n")
 
-    lines.append("")
-    lines.append("=" * 80)
+    w("\n")
+    w(f"{_EQ}\n")
     review_url = review_data.get("review_url", f"/review/{note_id}")
-    lines.append(f"REVIEW URL: {review_url}")
-    lines.append("=" * 80)
+    w(f"REVIEW URL: {review_url}\n")
+    w(_EQ)
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 @app.command()
@@ -148,7 +172,7 @@ def create(
     }
 
     try:
-        response = httpx.post(f"{api_url}/review/create", json=payload, timeout=30.0)
+        response = _get_client(api_url).post("/review/create", json=payload, timeout=30.0)
         response.raise_for_status()
 
         review_data = response.json()
@@ -157,9 +181,9 @@ def create(
         console.print(format_review(review_data))
 
         if show_json:
-            console.print("\n" + "=" * 80)
+            console.print("\n" + _EQ)
             console.print("RAW JSON:")
-            console.print("=" * 80)
+            console.print(_EQ)
             console.print_json(data=review_data)
 
     except httpx.HTTPStatusError as e:
@@ -189,7 +213,7 @@ def view(
     """
 
     try:
-        response = httpx.get(f"{api_url}/review/{note_id}", timeout=20.0)
+        response = _get_client(api_url).get(f"/review/{note_id}")
         response.raise_for_status()
 
         review_data = response.json()
@@ -3,6 +3,8 @@
 Usage:
     uv run python cli/test_extraction.py --transcript-id TX-001-follow-up
     uv run python cli/test_extraction.py --run-all
+    uv run python cli/test_extraction.py test-all --concurrency 8
+    uv run python cli/test_extraction.py test-all --cache  # replay stored LLM responses
     uv run python cli/test_extraction.py --provider openai --model gpt-4o
 """
 
@@ -16,29 +18,37 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from src.extraction.llm_client import create_llm_client
+from src.extraction.cache import CachingLLMClient
+from src.extraction.llm_client import LLMClient, create_llm_client
 from src.extraction.llm_parser import LLMTranscriptParser
 
 app = typer.Typer(help="Test clinical data extraction accuracy")
 console = Console()
 
 SAMPLE_TRANSCRIPTS_PATH = Path(__file__).parent.parent / "tests" / "fixtures" / "sample_transcripts.json"
+DEFAULT_CONCURRENCY = 4
 
 
 def load_transcripts() -> list[dict[str, Any]]:
     """Load sample transcripts from fixtures."""
     with open(SAMPLE_TRANSCRIPTS_PATH, encoding="utf-8") as f:
         data = json.load(f)
-    return data["transcripts"]
+    transcripts: list[dict[str, Any]] = data["transcripts"]
+    return transcripts
 
 
-def load_transcript_by_id(transcript_id: str) -> dict[str, Any] | None:
-    """Load a specific transcript by ID."""
-    transcripts = load_transcripts()
-    for t in transcripts:
-        if t["id"] == transcript_id:
-            return t
-    return None
+def find_transcript(transcripts: list[dict[str, Any]], transcript_id: str) -> dict[str, Any] | None:
+    """Find a transcript by ID in an already loaded list."""
+    return next((t for t in transcripts if t["id"] == transcript_id), None)
+
+
+def create_run_client(provider: str, model: str | None, cache: bool) -> LLMClient:
+    """Create the LLM client for a run, wrapped in the on-disk response cache if requested."""
+    client = create_llm_client(provider, model=model)
+    if not cache:
+        return client
+    model_id = getattr(client, "model", None) or getattr(client, "deployment", None)
+    return CachingLLMClient(client, model=f"{provider}:{model_id}")
 
 
 def compare_extraction(result: Any, expected: dict[str, Any]) -> dict[str, Any]:
@@ -70,14 +80,13 @@ def compare_extraction(result: Any, expected: dict[str, Any]) -> dict[str, Any]:
 
 async def test_single_transcript(
     transcript: dict[str, Any],
-    provider: str = "synthetic",
-    model: str | None = None,
+    parser: LLMTranscriptParser,
     verbose: bool = False,
 ) -> dict[str, Any]:
-    """Test extraction on a single transcript."""
-    client = create_llm_client(provider, model=model)
-    parser = LLMTranscriptParser(llm_client=client, reference_date=date.today())
+    """Test extraction on a single transcript.
 
+    The caller owns ``parser`` and its client, so one parser and connection pool can serve a whole run.
+    """
     try:
         result = await parser.parse(transcript["text"])
 
@@ -106,18 +115,13 @@ async def test_single_transcript(
             for med in result.medications:
                 console.print(f"  - {med.name} ({med.status.value})")
 
-        await client.close()
-
         return {
             "id": transcript["id"],
             "accuracy": accuracy,
             "confidence": comparison["confidence"],
-            "comparison": comparison,
-            "result": result,
         }
 
     except Exception as e:
-        await client.close()
         return {
             "id": transcript["id"],
             "accuracy": 0.0,
@@ -125,6 +129,31 @@ async def test_single_transcript(
         }
 
 
+async def test_transcripts_concurrently(
+    transcripts: list[dict[str, Any]],
+    parser: LLMTranscriptParser,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[dict[str, Any]]:
+    """Test extraction on several transcripts concurrently, returning results in input order.
+
+    At most ``concurrency`` LLM calls are in flight at once. Each result line is
+    printed as soon as its transcript finishes.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(transcript: dict[str, Any]) -> dict[str, Any]:
+        async with semaphore:
+            result = await test_single_transcript(transcript, parser, verbose=False)
+
+        if "error" in result:
+            console.print(f"Processed {transcript['id']}: [red]ERROR: {result['error'][:50]}...[/red]")
+        else:
+            console.print(f"Processed {transcript['id']}: [green]{result['accuracy']:.0%}[/green]")
+        return result
+
+    return list(await asyncio.gather(*(run_one(t) for t in transcripts)))
+
+
 @app.command()
 def test_transcript(
     transcript_id: str = typer.Option(
@@ -133,13 +162,15 @@ def test_transcript(
     provider: str = typer.Option("synthetic", "--provider", "-p", help="LLM provider (openai, azure, synthetic)"),
     model: str | None = typer.Option(None, "--model", "-m", help="Model name (optional)"),
     verbose: bool = typer.Option(True, "--verbose", "-v", help="Show detailed output"),
+    cache: bool = typer.Option(False, "--cache/--no-cache", help="Reuse stored LLM responses for identical prompts"),
 ) -> None:
     """Test extraction on a single transcript."""
-    transcript = load_transcript_by_id(transcript_id)
+    transcripts = load_transcripts()
+    transcript = find_transcript(transcripts, transcript_id)
 
     if not transcript:
         console.print(f"[red]Transcript {transcript_id} not found[/red]")
-        available = [t["id"] for t in load_transcripts()]
+        available = [t["id"] for t in transcripts]
         console.print(f"Available IDs: {', '.join(available[:5])}...")
         raise typer.Exit(1)
 
@@ -147,7 +178,12 @@ def test_transcript(
     console.print(f"Provider: {provider}")
     console.print(f"Text: {transcript['text'][:100]}...\n")
 
-    result = asyncio.run(test_single_transcript(transcript, provider, model, verbose))
+    async def _run() -> dict[str, Any]:
+        async with create_run_client(provider, model, cache) as client:
+            parser = LLMTranscriptParser(llm_client=client, reference_date=date.today())
+            return await test_single_transcript(transcript, parser, verbose)
+
+    result = asyncio.run(_run())
 
     if "error" in result:
         console.print(f"[red]Error: {result['error']}[/red]")
@@ -162,6 +198,10 @@ def test_all(
     provider: str = typer.Option("synthetic", "--provider", "-p", help="LLM provider"),
     model: str | None = typer.Option(None, "--model", "-m", help="Model name"),
     limit: int | None = typer.Option(None, "--limit", "-n", help="Limit number of transcripts to test"),
+    concurrency: int = typer.Option(
+        DEFAULT_CONCURRENCY, "--concurrency", "-c", min=1, help="Maximum concurrent LLM requests"
+    ),
+    cache: bool = typer.Option(False, "--cache/--no-cache", help="Reuse stored LLM responses for identical prompts"),
 ) -> None:
     """Test extraction on all sample transcripts and report accuracy."""
     transcripts = load_transcripts()
@@ -172,16 +212,16 @@ def test_all(
     console.print(f"[bold]Testing extraction on {len(transcripts)} transcripts[/bold]")
     console.print(f"Provider: {provider}\n")
 
-    results = []
-    for transcript in transcripts:
-        console.print(f"Processing {transcript['id']}...", end=" ")
-        result = asyncio.run(test_single_transcript(transcript, provider, model, verbose=False))
-        results.append(result)
+    async def _run() -> list[dict[str, Any]]:
+        # One client, and so one HTTP connection pool, for the whole run
+        async with create_run_client(provider, model, cache) as client:
+            parser = LLMTranscriptParser(llm_client=client, reference_date=date.today())
+            results = await test_transcripts_concurrently(transcripts, parser, concurrency)
+            if isinstance(client, CachingLLMClient):
+                console.print(f"Response cache: {client.hits} hits, {client.misses} misses")
+            return results
 
-        if "error" in result:
-            console.print(f"[red]ERROR: {result['error'][:50]}...[/red]")
-        else:
-            console.print(f"[green]{result['accuracy']:.0%}[/green]")
+    results = asyncio.run(_run())
 
     # Calculate overall accuracy
     successful = [r for r in results if "error" not in r]
@@ -48,9 +48,6 @@ async def main() -> None:
     print("=" * 60)
     print()
 
-    # Initialize the workflow
-    workflow = VerificationWorkflow()
-
     # Example patient ID from HAPI FHIR sandbox
     # This is a real patient in the public sandbox
     patient_id = "90128869"
@@ -70,12 +67,13 @@ async def main() -> None:
     print()
 
     try:
-        # Run the complete workflow
-        result = await workflow.verify_patient_documentation(
-            patient_id=patient_id,
-            transcript=transcript,
-            reference_date=date.today(),
-        )
+        # Run the complete workflow; leaving the block closes its connections
+        async with VerificationWorkflow() as workflow:
+            result = await workflow.verify_patient_documentation(
+                patient_id=patient_id,
+                transcript=transcript,
+                reference_date=date.today(),
+            )
 
         # Display results
         if result.is_success and result.value:
@@ -115,9 +113,6 @@ async def main() -> None:
     except Exception as e:
         print(f"✗ Workflow failed: {e}")
         raise
-    finally:
-        # Clean up resources
-        await workflow.close()
 
 
 if __name__ == "__main__":
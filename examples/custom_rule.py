@@ -3,7 +3,8 @@
 
 import asyncio
 import re
-from datetime import date
+from collections import Counter
+from datetime import date, datetime
 
 from src.engine import ComplianceEngine
 from src.models import (
@@ -20,6 +21,8 @@ from src.models import (
 class CustomComplianceEngine(ComplianceEngine):
     """Extended engine with custom rules."""
 
+    _MEDICATION_PATTERN = re.compile(r"\b(Metformin|Lisinopril|Insulin)\b")
+
     def verify(
         self,
         patient: PatientProfile,
@@ -50,8 +53,8 @@ class CustomComplianceEngine(ComplianceEngine):
         CustomComplianceEngine._verify_allergy_warnings(patient, ai_output, verification.alerts)
 
         # Recalculate score if new alerts added
-        if verification.alerts and any(a.severity == ComplianceSeverity.CRITICAL for a in verification.alerts):
-            critical = [a for a in verification.alerts if a.severity == ComplianceSeverity.CRITICAL]
+        critical = [a for a in verification.alerts if a.severity == ComplianceSeverity.CRITICAL]
+        if critical:
             return Result.failure(error=critical)
 
         return Result.success(value=verification)
@@ -59,14 +62,14 @@ class CustomComplianceEngine(ComplianceEngine):
     @staticmethod
     def _check_medication_duplicates(ai_output: AIGeneratedOutput, alerts: list[ComplianceAlert]) -> None:
         """Custom Rule: Detect duplicate medications."""
-        meds = re.findall(r"\b(Metformin|Lisinopril|Insulin)\b", ai_output.summary_text)
-        unique_meds = set(meds)
+        counts = Counter(CustomComplianceEngine._MEDICATION_PATTERN.findall(ai_output.summary_text))
+        duplicates = {med for med, count in counts.items() if count > 1}
 
-        if len(meds) != len(unique_meds):
+        if duplicates:
             alerts.append(
                 ComplianceAlert(
                     rule_id="CUSTOM_DUPLICATE_MEDICATION",
-                    message=(f"Duplicate medication mentioned: {set(m for m in meds if meds.count(m) > 1)}"),
+                    message=f"Duplicate medication mentioned: {duplicates}",
                     severity=ComplianceSeverity.HIGH,
                     field="summary_text",
                 )
@@ -80,8 +83,9 @@ class CustomComplianceEngine(ComplianceEngine):
         if not patient.allergies:
             return
 
+        summary = ai_output.summary_text.lower()
         for allergy in patient.allergies:
-            if allergy.lower() not in ai_output.summary_text.lower():
+            if allergy.lower() not in summary:
                 alerts.append(
                     ComplianceAlert(
                         rule_id="CUSTOM_ALLERGY_WARNING_MISSING",
@@ -108,7 +112,7 @@ async def main() -> None:
     context = EMRContext(
         visit_id="V-001",
         patient_id="12345",
-        admission_date=__import__("datetime").datetime(2025, 2, 21),
+        admission_date=datetime(2025, 2, 21),
         attending_physician="Dr. Johnson",
         raw_notes="Patient with diabetes",
     )
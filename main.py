@@ -2,6 +2,11 @@ import os
 
 import uvicorn
 
+# Auto-reload is for local development only: it runs the server under a file-watcher process.
+API_RELOAD = os.environ.get("API_RELOAD", "false").lower() == "true"
+# /stats is kept in process memory, so with more than one worker each request sees one worker's counts.
+API_WORKERS = int(os.environ.get("API_WORKERS", "1"))
+
 if __name__ == "__main__":
     # Ensure reports directory exists
     os.makedirs("reports", exist_ok=True)
@@ -12,4 +17,11 @@ if __name__ == "__main__":
 
     # Run the FastAPI app
     # host 0.0.0.0 for container support, port 8000
-    uvicorn.run("src.api:app", host="0.0.0.0", port=8000, reload=True)
+    # uvicorn picks uvloop and httptools automatically when they are installed
+    uvicorn.run(
+        "src.api:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=API_RELOAD,
+        workers=None if API_RELOAD else API_WORKERS,
+    )
@@ -27,6 +27,12 @@ def set_sqlite_pragma(dbapi_connection, connection_record):  # type: ignore[no-u
     cursor.execute("PRAGMA busy_timeout=5000")
     # Foreign Keys: Enforce constraints
     cursor.execute("PRAGMA foreign_keys=ON")
+    # Page Cache: Up to 64 MiB per connection (negative value is KiB), default is 2 MiB
+    cursor.execute("PRAGMA cache_size=-65536")
+    # Temp Store: Keep temporary tables and sort indices in memory instead of temp files
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    # Memory-Mapped I/O: Read up to 256 MiB of the file via mmap, avoiding copies into SQLite buffers
+    cursor.execute("PRAGMA mmap_size=268435456")
     cursor.close()
 
 
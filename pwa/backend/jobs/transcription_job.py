@@ -61,7 +61,7 @@ async def process_transcription(recording_id: UUID) -> None:
 
             # Trigger extraction
             logger.info("[Transcription] Triggering extraction for %s", recording_id)
-            await process_extraction(recording_id)
+            await process_extraction(recording_id, db)
 
         except TranscriptionError as e:
             logger.error("Transcription failed for %s: %s", recording_id, e)
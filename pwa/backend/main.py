@@ -1,3 +1,4 @@
+import logging
 from pathlib import Path
 
 from fastapi import FastAPI
@@ -10,6 +11,8 @@ from pwa.backend.models.recording import RecordingStatus
 from pwa.backend.routes import pages, recordings
 from pwa.backend.services.recording_service import RecordingService
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI(title=settings.app_name, debug=settings.debug)
 
 app.add_middleware(
@@ -47,4 +50,4 @@ async def recover_zombie_jobs() -> None:
                 RecordingStatus.ERROR,
                 error_message="Job lost due to server restart",
             )
-            print(f"[Recovery] Marked zombie job {recording.id} as failed")
+            logger.warning("[Recovery] Marked zombie job %s as failed", recording.id)
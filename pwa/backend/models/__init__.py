@@ -1,6 +1,6 @@
 """PWA backend models."""
 
-from pwa.backend.models.recording import Recording, RecordingStatus
+from pwa.backend.models.recording import Recording, RecordingStatus, RecordingSummary
 from pwa.backend.models.recording_sql import RecordingModel
 
-__all__ = ["Recording", "RecordingModel", "RecordingStatus"]
+__all__ = ["Recording", "RecordingModel", "RecordingStatus", "RecordingSummary"]
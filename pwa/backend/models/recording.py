@@ -7,6 +7,11 @@ from uuid import UUID, uuid4
 from pydantic import BaseModel, ConfigDict, Field
 
 
+def utc_now() -> datetime:
+    """Current time in UTC, used as the default for timestamp fields."""
+    return datetime.now(UTC)
+
+
 class RecordingStatus(StrEnum):
     """Status of a recording."""
 
@@ -36,8 +41,8 @@ class Recording(BaseModel):
     retry_count: int = 0
 
     # Timestamps
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime = Field(default_factory=utc_now)
+    updated_at: datetime = Field(default_factory=utc_now)
     uploaded_at: datetime | None = None
     processed_at: datetime | None = None
 
@@ -79,3 +84,16 @@ class Recording(BaseModel):
             }
         },
     )
+
+
+class RecordingSummary(BaseModel):
+    """Slim view of a recording for list endpoints, without transcripts or results."""
+
+    id: UUID
+    patient_id: str
+    clinician_id: str
+    duration_seconds: int | None = None
+    status: RecordingStatus
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
@@ -1,6 +1,6 @@
 """SQLAlchemy model for Recording."""
 
-from datetime import UTC, datetime
+from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
@@ -8,6 +8,7 @@ from sqlalchemy import JSON, DateTime, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from pwa.backend.database import Base
+from pwa.backend.models.recording import utc_now
 
 
 class RecordingModel(Base):  # type: ignore
@@ -41,11 +42,11 @@ class RecordingModel(Base):  # type: ignore
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        default=lambda: datetime.now(UTC),
+        default=utc_now,
     )
     updated_at: Mapped[datetime] = mapped_column(
-        default=lambda: datetime.now(UTC),
-        onupdate=lambda: datetime.now(UTC),
+        default=utc_now,
+        onupdate=utc_now,
     )
     uploaded_at: Mapped[datetime | None] = mapped_column(nullable=True)
     processed_at: Mapped[datetime | None] = mapped_column(nullable=True)
@@ -86,4 +87,5 @@ class RecordingModel(Base):  # type: ignore
         Index("ix_recordings_clinician_id", "clinician_id"),
         Index("ix_recordings_status", "status"),
         Index("ix_recordings_created_at", "created_at"),
+        Index("ix_recordings_clinician_status_created", "clinician_id", "status", "created_at"),
     )
@@ -1,14 +1,29 @@
 from pathlib import Path
 
+import jinja2
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 
+from pwa.backend.config import settings
+
 router = APIRouter(tags=["pages"])
 
 # Use absolute path from project root for templates
 TEMPLATES_DIR = Path(__file__).parent.parent.parent / "frontend" / "templates"
-templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
+
+
+def _build_environment(templates_dir: Path) -> jinja2.Environment:
+    """Create the Jinja2 environment used to render page templates."""
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(templates_dir),
+        autoescape=jinja2.select_autoescape(),
+        # Outside debug mode, compiled templates are served from memory without re-checking their files
+        auto_reload=settings.debug,
+    )
+
+
+templates = Jinja2Templates(env=_build_environment(TEMPLATES_DIR))
 
 
 @router.get("/", response_class=HTMLResponse)
@@ -12,6 +12,8 @@ from pwa.backend.services.recording_service import RecordingService
 
 router = APIRouter(prefix="/api/v1/recordings", tags=["recordings"])
 
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
 
 class CreateRecordingRequest(BaseModel):
     patient_id: str
@@ -81,9 +83,13 @@ async def upload_recording(
     # TODO: Get clinician_id from auth token
     clinician_id = "current-clinician"
 
-    # Read audio content
-    audio_content = await audio.read()
-    audio_file_size = len(audio_content)
+    # Starlette records the size while spooling the upload; only count it ourselves if it
+    # is missing, and then in chunks so a long recording is never held in memory at once
+    audio_file_size = audio.size
+    if audio_file_size is None:
+        audio_file_size = 0
+        while chunk := await audio.read(UPLOAD_CHUNK_SIZE):
+            audio_file_size += len(chunk)
 
     # TODO: Save audio file to disk (Phase 2a - basic implementation)
     # For now, just store the size
@@ -146,7 +152,7 @@ async def list_recordings(
     clinician_id = "current-clinician"
 
     service = RecordingService(db)
-    recordings = await service.get_recordings_for_clinician(clinician_id, status)
+    recordings = await service.get_recording_summaries_for_clinician(clinician_id, status)
 
     return [
         RecordingResponse(
@@ -3,10 +3,11 @@ from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
-from pwa.backend.models.recording import Recording, RecordingStatus
+from pwa.backend.models.recording import Recording, RecordingStatus, RecordingSummary
 from pwa.backend.models.recording_sql import RecordingModel
 
 
@@ -61,6 +62,34 @@ class RecordingService:
         recording_models = result.scalars().all()
         return [Recording.model_validate(r) for r in recording_models]
 
+    async def get_recording_summaries_for_clinician(
+        self, clinician_id: str, status: RecordingStatus | None = None
+    ) -> list[RecordingSummary]:
+        """Get newest-first summaries of a clinician's recordings, optionally filtered by status.
+
+        Only the summary columns are selected, so transcripts and JSON results are never loaded.
+        """
+        query = (
+            select(RecordingModel)
+            .options(
+                load_only(
+                    RecordingModel.id,
+                    RecordingModel.patient_id,
+                    RecordingModel.clinician_id,
+                    RecordingModel.duration_seconds,
+                    RecordingModel.status,
+                    RecordingModel.created_at,
+                )
+            )
+            .where(RecordingModel.clinician_id == clinician_id)
+            .order_by(RecordingModel.created_at.desc())
+        )
+        if status:
+            query = query.where(RecordingModel.status == status.value)
+        result = await self.db.execute(query)
+        recording_models = result.scalars().all()
+        return [RecordingSummary.model_validate(r) for r in recording_models]
+
     async def update_recording_status(
         self,
         recording_id: UUID,
@@ -71,28 +100,30 @@ class RecordingService:
         transcription_started_at: datetime | None = None,
         transcription_completed_at: datetime | None = None,
     ) -> Recording | None:
-        """Update the status of a recording."""
-        result = await self.db.execute(select(RecordingModel).where(RecordingModel.id == recording_id))
-        recording_model = result.scalar_one_or_none()
-        if recording_model is None:
-            return None
-
-        recording_model.status = status.value
+        """Update the status of a recording.
+
+        Runs as a single UPDATE ... RETURNING, like update_recording. Optional fields
+        left as None (or an empty error_message) are not changed.
+        """
+        values: dict[str, Any] = {
+            "final_transcript": final_transcript,
+            "whisper_model": whisper_model,
+            "transcription_started_at": transcription_started_at,
+            "transcription_completed_at": transcription_completed_at,
+        }
+        values = {column: value for column, value in values.items() if value is not None}
         if error_message:
-            recording_model.error_message = error_message
-        if final_transcript is not None:
-            recording_model.final_transcript = final_transcript
-        if whisper_model is not None:
-            recording_model.whisper_model = whisper_model
-        if transcription_started_at is not None:
-            recording_model.transcription_started_at = transcription_started_at
-        if transcription_completed_at is not None:
-            recording_model.transcription_completed_at = transcription_completed_at
-
-        recording_model.updated_at = datetime.now(UTC)
+            values["error_message"] = error_message
+        values["status"] = status.value
+        values["updated_at"] = datetime.now(UTC)
 
+        result = await self.db.execute(
+            update(RecordingModel).where(RecordingModel.id == recording_id).values(values).returning(RecordingModel)
+        )
+        recording_model = result.scalar_one_or_none()
         await self.db.commit()
-        await self.db.refresh(recording_model)
+        if recording_model is None:
+            return None
         return Recording.model_validate(recording_model)
 
     async def update_recording(
@@ -107,33 +138,31 @@ class RecordingService:
         verified_at: datetime | None = None,
         status: RecordingStatus | None = None,
     ) -> Recording | None:
-        """Update recording with extraction results."""
-        result = await self.db.execute(select(RecordingModel).where(RecordingModel.id == recording_id))
+        """Update recording with extraction results.
+
+        Runs as a single UPDATE ... RETURNING, so the row is neither selected first
+        nor refreshed afterwards. Fields left as None are not changed.
+        """
+        values: dict[str, Any] = {
+            "extraction_started_at": extraction_started_at,
+            "fhir_bundle": fhir_bundle,
+            "llm_model": llm_model,
+            "extraction_completed_at": extraction_completed_at,
+            "verification_results": verification_results,
+            "verification_score": verification_score,
+            "verified_at": verified_at,
+            "status": status.value if status is not None else None,
+        }
+        values = {column: value for column, value in values.items() if value is not None}
+        values["updated_at"] = datetime.now(UTC)
+
+        result = await self.db.execute(
+            update(RecordingModel).where(RecordingModel.id == recording_id).values(values).returning(RecordingModel)
+        )
         recording_model = result.scalar_one_or_none()
+        await self.db.commit()
         if recording_model is None:
             return None
-
-        if extraction_started_at is not None:
-            recording_model.extraction_started_at = extraction_started_at
-        if fhir_bundle is not None:
-            recording_model.fhir_bundle = fhir_bundle
-        if llm_model is not None:
-            recording_model.llm_model = llm_model
-        if extraction_completed_at is not None:
-            recording_model.extraction_completed_at = extraction_completed_at
-        if verification_results is not None:
-            recording_model.verification_results = verification_results
-        if verification_score is not None:
-            recording_model.verification_score = verification_score
-        if verified_at is not None:
-            recording_model.verified_at = verified_at
-        if status is not None:
-            recording_model.status = status.value
-
-        recording_model.updated_at = datetime.now(UTC)
-
-        await self.db.commit()
-        await self.db.refresh(recording_model)
         return Recording.model_validate(recording_model)
 
     async def get_recordings_stuck_in_processing(self, minutes: int = 30) -> list[Recording]:
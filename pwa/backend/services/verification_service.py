@@ -1,22 +1,38 @@
 # pwa/backend/services/verification_service.py
 """Clinical verification service for extracted data."""
 
+import re
+import string
 from typing import Any
 
 # Known medications list (simplified - use RxNorm in production)
-KNOWN_MEDICATIONS = {
-    "metformin",
-    "insulin",
-    "lisinopril",
-    "atorvastatin",
-    "amlodipine",
-    "albuterol",
-    "omeprazole",
-    "gabapentin",
-}
+KNOWN_MEDICATIONS = frozenset(
+    {
+        "metformin",
+        "insulin",
+        "lisinopril",
+        "atorvastatin",
+        "amlodipine",
+        "albuterol",
+        "omeprazole",
+        "gabapentin",
+    }
+)
 
 # Known conditions (simplified - use ICD-10 in production)
-KNOWN_CONDITIONS = {"diabetes", "hypertension", "asthma", "depression", "anxiety", "arthritis", "copd", "heart failure"}
+KNOWN_CONDITIONS = frozenset(
+    {"diabetes", "hypertension", "asthma", "depression", "anxiety", "arthritis", "copd", "heart failure"}
+)
+
+_DIGIT = re.compile(r"\d")
+
+# LLM output often carries stray punctuation ("Metformin,"), which would otherwise miss the lookups
+_STRIP_PUNCTUATION = str.maketrans("", "", string.punctuation)
+
+
+def _normalize_name(name: str) -> str:
+    """Normalize an extracted name for lookup in the known-entity sets."""
+    return name.translate(_STRIP_PUNCTUATION).strip().lower()
 
 
 class VerificationService:
@@ -40,24 +56,21 @@ class VerificationService:
             issues.append(f"Low confidence: {confidence}")
             score -= 0.3
 
-        # Check 2: Medication names
+        # Checks 2 and 3: Medication names and dosage format, in one pass
         for med in extracted_data.get("medications", []):
-            name = med.get("name", "").lower()
+            name = _normalize_name(med.get("name", ""))
             if name and name not in KNOWN_MEDICATIONS:
                 issues.append(f"Unknown medication: {name}")
                 score -= 0.1
 
-        # Check 3: Dosage format
-        for med in extracted_data.get("medications", []):
             dosage = med.get("dosage", "")
-            if dosage and not any(c.isdigit() for c in dosage):
+            if dosage and not _DIGIT.search(dosage):
                 issues.append(f"Invalid dosage format: {dosage}")
                 score -= 0.1
 
         # Check 4: Conditions
         for condition in extracted_data.get("conditions", []):
-            condition_lower = condition.lower()
-            if condition_lower not in KNOWN_CONDITIONS:
+            if _normalize_name(condition) not in KNOWN_CONDITIONS:
                 issues.append(f"Unknown condition: {condition}")
                 score -= 0.05
 
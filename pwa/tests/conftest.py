@@ -5,7 +5,6 @@ from collections.abc import AsyncGenerator
 import pytest
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
 
 from pwa.backend.database import Base, get_db
 from pwa.backend.main import app
@@ -48,15 +47,7 @@ async def test_db_connection(test_engine: AsyncEngine) -> AsyncGenerator[AsyncCo
 @pytest_asyncio.fixture
 async def test_db_session(test_db_connection: AsyncConnection) -> AsyncGenerator[AsyncSession, None]:
     """Create a test database session bound to the connection."""
-    async_session = sessionmaker(
-        bind=test_db_connection,
-        class_=AsyncSession,
-        expire_on_commit=False,
-        autoflush=False,
-        autocommit=False,
-    )
-
-    async with async_session() as session:
+    async with AsyncSession(bind=test_db_connection, expire_on_commit=False, autoflush=False) as session:
         yield session
 
 
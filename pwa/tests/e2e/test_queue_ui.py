@@ -1,18 +1,6 @@
 """Playwright tests for Queue UI."""
 
-from playwright.sync_api import Page, expect
-
-
-def test_queue_page_loads(page: Page) -> None:
-    """Test that queue page loads."""
-    page.goto("http://localhost:8002/queue")
-
-    # Verify page title
-    expect(page).to_have_title("Clinical Transcription PWA")
-
-    # Verify queue heading exists
-    heading = page.locator('h2:has-text("Recording Queue")')
-    expect(heading).to_be_visible()
+from playwright.sync_api import Browser, Page, expect
 
 
 def test_queue_shows_empty_state(page: Page) -> None:
@@ -24,12 +12,16 @@ def test_queue_shows_empty_state(page: Page) -> None:
     expect(empty_msg).to_be_visible()
 
 
-def test_queue_shows_ios_warning(page: Page) -> None:
+def test_queue_shows_ios_warning(browser: Browser) -> None:
     """Test that iOS warning appears on iOS devices."""
-    # Simulate iOS user agent
-    page.context.set_extra_http_headers({"User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 16_0 like Mac OS X)"})
+    # Simulate iOS user agent; queue.js reads navigator.userAgent, which only the context can set
+    context = browser.new_context(user_agent="Mozilla/5.0 (iPhone; CPU iPhone OS 16_0 like Mac OS X)")
+    page = context.new_page()
 
-    page.goto("http://localhost:8002/queue")
+    try:
+        page.goto("http://localhost:8002/queue")
 
-    # The iOS warning might not appear in Playwright, but we can check the page loads
-    expect(page).to_have_title("Clinical Transcription PWA")
+        # The iOS warning might not appear in Playwright, but we can check the page loads
+        expect(page).to_have_title("Clinical Transcription PWA")
+    finally:
+        context.close()
@@ -7,8 +7,16 @@ def test_service_worker_registers(page: Page) -> None:
     """Test that service worker registers successfully."""
     page.goto("http://localhost:8002/")
 
-    # Wait for registration to complete
-    page.wait_for_timeout(2000)
+    # Wait for registration to complete. The worker's scope is /static/js/, so pages at /
+    # are never controlled by it and navigator.serviceWorker.ready would not resolve.
+    page.wait_for_function(
+        """async () => {
+            if (!('serviceWorker' in navigator)) return true;
+            const registrations = await navigator.serviceWorker.getRegistrations();
+            return registrations.some(r => r.scope.includes('/static/js/'));
+        }""",
+        timeout=5000,
+    )
 
     result = page.evaluate("""
         async () => {
@@ -47,8 +55,8 @@ def test_service_worker_caches_assets(page: Page) -> None:
     """Test that static assets are cached."""
     page.goto("http://localhost:8002/")
 
-    # Wait for SW to be ready
-    page.wait_for_timeout(1000)
+    # Wait for the service worker's install step to open its cache
+    page.wait_for_function("async () => (await caches.keys()).length > 0", timeout=5000)
 
     result = page.evaluate("""
         async () => {
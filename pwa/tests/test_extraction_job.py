@@ -1,7 +1,14 @@
 # pwa/tests/test_extraction_job.py
 """Tests for extraction job."""
 
+from typing import Any
+
 import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from pwa.backend.models.recording import RecordingStatus
+from pwa.backend.services.extraction_service import LLMService
+from pwa.backend.services.recording_service import RecordingService
 
 
 class TestExtractionJobModule:
@@ -65,3 +72,36 @@ class TestExtractionJobErrorHandling:
                             has_error_update = True
 
         assert has_error_update, "Missing error handling that updates recording status"
+
+
+class TestExtractionJobSession:
+    """Tests for running the extraction job on the caller's session."""
+
+    @pytest.mark.asyncio  # type: ignore[untyped-decorator]
+    async def test_process_extraction_uses_given_session(
+        self, test_db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that extraction and verification results are written through the given session."""
+        from pwa.backend.jobs.extraction_job import process_extraction
+
+        async def fake_extract(self: LLMService, transcript: str, patient_id: str) -> dict[str, Any]:
+            return {"model": "test-model", "confidence": 0.9, "medications": [{"name": "Metformin", "dosage": "500mg"}]}
+
+        monkeypatch.setattr(LLMService, "extract", fake_extract)
+        service = RecordingService(test_db_session)
+        recording = await service.create_recording(
+            patient_id="patient-123", clinician_id="clinician-456", duration_seconds=60
+        )
+        await service.update_recording_status(
+            recording.id, RecordingStatus.COMPLETED, final_transcript="Continue Metformin 500mg."
+        )
+
+        await process_extraction(recording.id, test_db_session)
+
+        updated = await service.get_recording(recording.id)
+        assert updated is not None
+        assert updated.llm_model == "test-model"
+        assert updated.verification_results is not None
+        assert updated.verification_results["passed"] is True
+        assert updated.status == RecordingStatus.COMPLETED
+        assert updated.verified_at == updated.extraction_completed_at
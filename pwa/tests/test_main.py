@@ -1,11 +1,16 @@
+import pytest
 from fastapi.testclient import TestClient
 
 from pwa.backend.main import app
 
-client = TestClient(app)
 
+@pytest.fixture
+def client() -> TestClient:
+    """Create a test client for the FastAPI app."""
+    return TestClient(app)
 
-def test_health_check() -> None:
+
+def test_health_check(client: TestClient) -> None:
     """Test that the PWA API health endpoint works."""
     response = client.get("/api/v1/health")
     assert response.status_code == 200
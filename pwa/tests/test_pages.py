@@ -1,13 +1,50 @@
+import os
+from pathlib import Path
+
+import pytest
 from fastapi.testclient import TestClient
 
+from pwa.backend.config import settings
 from pwa.backend.main import app
+from pwa.backend.routes.pages import _build_environment
+
 
-client = TestClient(app)
+@pytest.fixture
+def client() -> TestClient:
+    """Create a test client for the FastAPI app."""
+    return TestClient(app)
 
 
-def test_home_page() -> None:
+def test_home_page(client: TestClient) -> None:
     """Test that the home page loads."""
     response = client.get("/")
     assert response.status_code == 200
     assert "text/html" in response.headers["content-type"]
     assert "Clinical Transcription" in response.text
+
+
+def test_queue_page(client: TestClient) -> None:
+    """Test that the queue page renders its title and heading."""
+    response = client.get("/queue")
+    assert response.status_code == 200
+    assert "<title>Clinical Transcription PWA</title>" in response.text
+    assert "<h2>Recording Queue</h2>" in response.text
+
+
+@pytest.mark.parametrize(("debug", "expected"), [(False, "first"), (True, "second")])
+def test_templates_only_reload_in_debug(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, debug: bool, expected: str
+) -> None:
+    """Test that edited template files are only picked up in debug mode."""
+    monkeypatch.setattr(settings, "debug", debug)
+    env = _build_environment(tmp_path)
+    template_file = tmp_path / "page.html"
+    template_file.write_text("first", encoding="utf-8")
+    assert env.get_template("page.html").render() == "first"
+
+    template_file.write_text("second", encoding="utf-8")
+    # Bump the mtime explicitly so the change is visible even on coarse-grained filesystems
+    mtime = template_file.stat().st_mtime + 10
+    os.utime(template_file, (mtime, mtime))
+
+    assert env.get_template("page.html").render() == expected
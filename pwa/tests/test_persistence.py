@@ -1,6 +1,7 @@
 """Tests for database persistence verification."""
 
 from collections.abc import AsyncGenerator
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
@@ -8,22 +9,22 @@ import pytest
 if TYPE_CHECKING:
     from uuid import UUID
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from pwa.backend.database import Base
 from pwa.backend.models.recording import RecordingStatus
 from pwa.backend.services.recording_service import RecordingService
 
-# Use file-based SQLite for persistence test
-TEST_DB_URL = "sqlite+aiosqlite:///./data/test_persistence.db"
-
 
 @pytest_asyncio.fixture  # type: ignore[untyped-decorator]
-async def persistence_db() -> AsyncGenerator[sessionmaker[AsyncSession], None]:
-    """Create a database connection that persists across the test."""
+async def persistence_db(tmp_path: Path) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    """Create a database connection that persists across the test.
+
+    Uses a file-based SQLite database in the test's temporary directory, since an
+    in-memory database would not outlive its connections.
+    """
     engine = create_async_engine(
-        TEST_DB_URL,
+        f"sqlite+aiosqlite:///{tmp_path / 'test_persistence.db'}",
         echo=False,
         future=True,
     )
@@ -33,12 +34,10 @@ async def persistence_db() -> AsyncGenerator[sessionmaker[AsyncSession], None]:
         await conn.run_sync(Base.metadata.create_all)
 
     # Create session factory
-    async_session_local = sessionmaker(
+    async_session_local = async_sessionmaker(
         engine,
-        class_=AsyncSession,
         expire_on_commit=False,
         autoflush=False,
-        autocommit=False,
     )
 
     yield async_session_local
@@ -51,7 +50,7 @@ async def persistence_db() -> AsyncGenerator[sessionmaker[AsyncSession], None]:
 
 @pytest.mark.asyncio  # type: ignore[untyped-decorator]
 async def test_data_persists_across_sessions(
-    persistence_db: sessionmaker[AsyncSession],
+    persistence_db: async_sessionmaker[AsyncSession],
 ) -> None:
     """Verify that data persists after closing and reopening database connection.
 
@@ -95,7 +94,7 @@ async def test_data_persists_across_sessions(
 
 @pytest.mark.asyncio  # type: ignore[untyped-decorator]
 async def test_data_persists_after_status_update(
-    persistence_db: sessionmaker[AsyncSession],
+    persistence_db: async_sessionmaker[AsyncSession],
 ) -> None:
     """Verify that status updates persist after closing and reopening connection."""
 
@@ -129,7 +128,7 @@ async def test_data_persists_after_status_update(
 
 @pytest.mark.asyncio  # type: ignore[untyped-decorator]
 async def test_multiple_recordings_persist(
-    persistence_db: sessionmaker[AsyncSession],
+    persistence_db: async_sessionmaker[AsyncSession],
 ) -> None:
     """Verify multiple recordings persist after reconnect."""
     recording_ids = []
@@ -160,7 +159,7 @@ async def test_multiple_recordings_persist(
 
 @pytest.mark.asyncio  # type: ignore[untyped-decorator]
 async def test_clinician_recordings_persist(
-    persistence_db: sessionmaker[AsyncSession],
+    persistence_db: async_sessionmaker[AsyncSession],
 ) -> None:
     """Verify clinician-specific queries work after reconnect."""
     clinician_id = "persist-clinician-test"
@@ -196,7 +195,8 @@ async def test_clinician_recordings_persist(
 
 @pytest.mark.asyncio  # type: ignore[untyped-decorator]
 async def test_data_survives_server_restart_simulation(
-    persistence_db: sessionmaker[AsyncSession],
+    persistence_db: async_sessionmaker[AsyncSession],
+    tmp_path: Path,
 ) -> None:
     """Simulate server restart by completely disposing and recreating engine.
 
@@ -207,15 +207,14 @@ async def test_data_survives_server_restart_simulation(
     """
     from uuid import uuid4
 
-    test_db_path = "./data/test_restart_simulation.db"
-    db_url = f"sqlite+aiosqlite:///{test_db_path}"
+    db_url = f"sqlite+aiosqlite:///{tmp_path / 'test_restart_simulation.db'}"
 
     recording_id = None
     patient_id = f"restart-test-{uuid4().hex[:8]}"
 
     # "Server 1": Create recording and dispose engine
     engine1 = create_async_engine(db_url, echo=False, future=True)
-    async_session1 = sessionmaker(engine1, class_=AsyncSession, expire_on_commit=False, autoflush=False)
+    async_session1 = async_sessionmaker(engine1, expire_on_commit=False, autoflush=False)
 
     async with engine1.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -236,7 +235,7 @@ async def test_data_survives_server_restart_simulation(
 
     # "Server 2": New engine, retrieve recording
     engine2 = create_async_engine(db_url, echo=False, future=True)
-    async_session2 = sessionmaker(engine2, class_=AsyncSession, expire_on_commit=False, autoflush=False)
+    async_session2 = async_sessionmaker(engine2, expire_on_commit=False, autoflush=False)
 
     async with async_session2() as session:
         service = RecordingService(session)
@@ -248,10 +247,3 @@ async def test_data_survives_server_restart_simulation(
         print("[Server 2] Persistence verified!")
 
     await engine2.dispose()
-
-    # Cleanup
-    import contextlib
-    import os
-
-    with contextlib.suppress(FileNotFoundError):
-        os.remove(test_db_path)
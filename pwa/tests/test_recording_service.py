@@ -1,9 +1,11 @@
 # pwa/tests/test_recording_service.py
+from typing import Any
 from uuid import uuid4
 
 import pytest
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from pwa.backend.models.recording import RecordingStatus
 from pwa.backend.services.recording_service import RecordingService
@@ -83,6 +85,23 @@ async def test_get_recordings_for_clinician_with_status(service: RecordingServic
     assert error_recordings[0].error_message == "Test error"
 
 
+@pytest.mark.asyncio
+async def test_get_recording_summaries_for_clinician(service: RecordingService) -> None:
+    """Test that summaries are filtered by clinician and status and listed newest first."""
+    first = await service.create_recording(patient_id="p1", clinician_id="clinician-a", duration_seconds=60)
+    second = await service.create_recording(patient_id="p2", clinician_id="clinician-a", duration_seconds=90)
+    await service.create_recording(patient_id="p3", clinician_id="clinician-b", duration_seconds=30)
+    await service.update_recording_status(first.id, RecordingStatus.COMPLETED)
+
+    summaries = await service.get_recording_summaries_for_clinician("clinician-a")
+    assert [s.id for s in summaries] == [second.id, first.id]
+    assert summaries[0].duration_seconds == 90
+
+    completed = await service.get_recording_summaries_for_clinician("clinician-a", RecordingStatus.COMPLETED)
+    assert [s.id for s in completed] == [first.id]
+    assert completed[0].status == RecordingStatus.COMPLETED
+
+
 @pytest.mark.asyncio
 async def test_update_recording_status(service: RecordingService) -> None:
     """Test updating a recording's status."""
@@ -103,8 +122,66 @@ async def test_update_recording_status(service: RecordingService) -> None:
     assert retrieved.status == RecordingStatus.COMPLETED
 
 
+@pytest.mark.asyncio
+async def test_update_recording_status_sets_optional_fields(service: RecordingService) -> None:
+    """Test that optional fields are written alongside the status and None leaves them unchanged."""
+    created = await service.create_recording(
+        patient_id="patient-123", clinician_id="clinician-456", duration_seconds=120
+    )
+
+    await service.update_recording_status(
+        created.id, RecordingStatus.PROCESSING, final_transcript="Patient reports chest pain.", whisper_model="small"
+    )
+    updated = await service.update_recording_status(created.id, RecordingStatus.ERROR, error_message="Timed out")
+
+    assert updated is not None
+    assert updated.status == RecordingStatus.ERROR
+    assert updated.error_message == "Timed out"
+    assert updated.final_transcript == "Patient reports chest pain."
+    assert updated.whisper_model == "small"
+
+
 @pytest.mark.asyncio
 async def test_update_nonexistent_recording(service: RecordingService) -> None:
     """Test updating a recording that doesn't exist."""
     result = await service.update_recording_status(uuid4(), RecordingStatus.COMPLETED)
     assert result is None
+
+
+@pytest.mark.asyncio
+async def test_update_recording_uses_single_statement(service: RecordingService, test_engine: AsyncEngine) -> None:
+    """Test that updating extraction results takes one UPDATE and no SELECT."""
+    created = await service.create_recording(
+        patient_id="patient-123", clinician_id="clinician-456", duration_seconds=120
+    )
+
+    statements: list[str] = []
+
+    def record(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        updated = await service.update_recording(
+            created.id, fhir_bundle={"resourceType": "Bundle"}, llm_model="test-model", status=RecordingStatus.COMPLETED
+        )
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+    assert updated is not None
+    assert updated.llm_model == "test-model"
+    assert updated.fhir_bundle == {"resourceType": "Bundle"}
+    assert updated.status == RecordingStatus.COMPLETED
+    assert updated.duration_seconds == 120
+    assert len(statements) == 1
+    assert statements[0].lstrip().upper().startswith("UPDATE")
+
+    retrieved = await service.get_recording(created.id)
+    assert retrieved is not None
+    assert retrieved.llm_model == "test-model"
+
+
+@pytest.mark.asyncio
+async def test_update_recording_nonexistent(service: RecordingService) -> None:
+    """Test updating extraction results for a recording that doesn't exist."""
+    assert await service.update_recording(uuid4(), llm_model="test-model") is None
@@ -4,108 +4,88 @@ from datetime import datetime
 from uuid import uuid4
 
 import pytest
-from sqlalchemy import select, text
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
-from pwa.backend.database import Base, engine
 from pwa.backend.models.recording import Recording, RecordingStatus
 from pwa.backend.models.recording_sql import RecordingModel
 
 
 @pytest.mark.asyncio  # type: ignore[untyped-decorator]
-async def test_recording_model_table_exists() -> None:
+async def test_recording_model_table_exists(test_db_connection: AsyncConnection) -> None:
     """Test that RecordingModel creates the recordings table."""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    async with engine.connect() as conn:
-        result = await conn.execute(text("SELECT name FROM sqlite_master WHERE type='table' AND name='recordings'"))
-        table = result.scalar()
-        assert table == "recordings"
+    has_table = await test_db_connection.run_sync(lambda sync_conn: inspect(sync_conn).has_table("recordings"))
+    assert has_table
 
 
 @pytest.mark.asyncio  # type: ignore[untyped-decorator]
-async def test_recording_model_has_all_columns() -> None:
+async def test_recording_model_has_all_columns(test_db_connection: AsyncConnection) -> None:
     """Test that RecordingModel has all required columns."""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    async with engine.connect() as conn:
-        result = await conn.execute(text("PRAGMA table_info(recordings)"))
-        columns = {row[1] for row in result.fetchall()}
-
-        expected_columns = {
-            "id",
-            "patient_id",
-            "clinician_id",
-            "audio_file_path",
-            "audio_file_size",
-            "duration_seconds",
-            "status",
-            "error_message",
-            "retry_count",
-            "created_at",
-            "updated_at",
-            "uploaded_at",
-            "processed_at",
-            "transcript",
-            "verification_results",
-        }
-        assert expected_columns.issubset(columns)
+    info = await test_db_connection.run_sync(lambda sync_conn: inspect(sync_conn).get_columns("recordings"))
+    columns = {column["name"] for column in info}
+
+    expected_columns = {
+        "id",
+        "patient_id",
+        "clinician_id",
+        "audio_file_path",
+        "audio_file_size",
+        "duration_seconds",
+        "status",
+        "error_message",
+        "retry_count",
+        "created_at",
+        "updated_at",
+        "uploaded_at",
+        "processed_at",
+        "transcript",
+        "verification_results",
+    }
+    assert expected_columns.issubset(columns)
 
 
 @pytest.mark.asyncio  # type: ignore[untyped-decorator]
-async def test_recording_model_indexes_exist() -> None:
+async def test_recording_model_indexes_exist(test_db_connection: AsyncConnection) -> None:
     """Test that indexes are created for patient_id, clinician_id, status, created_at."""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    async with engine.connect() as conn:
-        result = await conn.execute(text("SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='recordings'"))
-        indexes = {row[0] for row in result.fetchall()}
+    info = await test_db_connection.run_sync(lambda sync_conn: inspect(sync_conn).get_indexes("recordings"))
+    indexes = {index["name"] for index in info}
 
-        expected_indexes = {
-            "ix_recordings_patient_id",
-            "ix_recordings_clinician_id",
-            "ix_recordings_status",
-            "ix_recordings_created_at",
-        }
-        assert expected_indexes.issubset(indexes)
+    expected_indexes = {
+        "ix_recordings_patient_id",
+        "ix_recordings_clinician_id",
+        "ix_recordings_status",
+        "ix_recordings_created_at",
+    }
+    assert expected_indexes.issubset(indexes)
 
 
 @pytest.mark.asyncio  # type: ignore[untyped-decorator]
-async def test_recording_model_json_field() -> None:
+async def test_recording_model_json_field(test_db_session: AsyncSession) -> None:
     """Test that verification_results JSON field stores and retrieves dict data."""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
     test_data = {"confidence": 0.95, "matched_terms": ["term1", "term2"]}
     recording_id = uuid4()
 
-    async with AsyncSession(engine) as session:
-        recording = RecordingModel(
+    test_db_session.add(
+        RecordingModel(
             id=recording_id,
             patient_id="patient-123",
             clinician_id="clinician-456",
             verification_results=test_data,
         )
-        session.add(recording)
-        await session.commit()
+    )
+    await test_db_session.commit()
 
-    # Query back in a new session to verify JSON data
-    async with AsyncSession(engine) as session:
-        result = await session.execute(select(RecordingModel).where(RecordingModel.id == recording_id))
-        recording = result.scalar_one_or_none()
-        assert recording is not None
-        assert recording.verification_results == test_data
+    # Expire the identity map so the query reloads the JSON data from the database
+    test_db_session.expire_all()
+    result = await test_db_session.execute(select(RecordingModel).where(RecordingModel.id == recording_id))
+    recording = result.scalar_one_or_none()
+    assert recording is not None
+    assert recording.verification_results == test_data
 
 
 @pytest.mark.asyncio  # type: ignore[untyped-decorator]
 async def test_pydantic_to_sqlalchemy_mapping() -> None:
     """Test that Pydantic Recording can be converted to SQLAlchemy RecordingModel."""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
     # Create Pydantic model
     pydantic_recording = Recording(
         id=uuid4(),
@@ -139,52 +119,44 @@ async def test_pydantic_to_sqlalchemy_mapping() -> None:
 
 
 @pytest.mark.asyncio  # type: ignore[untyped-decorator]
-async def test_sqlalchemy_to_pydantic_mapping() -> None:
+async def test_sqlalchemy_to_pydantic_mapping(test_db_session: AsyncSession) -> None:
     """Test that SQLAlchemy RecordingModel can be converted to Pydantic Recording."""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    async with AsyncSession(engine) as session:
-        # Create SQLAlchemy model
-        recording_id = uuid4()
-        sqlalchemy_recording = RecordingModel(
-            id=recording_id,
-            patient_id="patient-123",
-            clinician_id="clinician-456",
-            status="pending",
-            verification_results={"confidence": 0.95},
-        )
-        session.add(sqlalchemy_recording)
-        await session.commit()
-        await session.refresh(sqlalchemy_recording)
+    # Create SQLAlchemy model
+    recording_id = uuid4()
+    sqlalchemy_recording = RecordingModel(
+        id=recording_id,
+        patient_id="patient-123",
+        clinician_id="clinician-456",
+        status="pending",
+        verification_results={"confidence": 0.95},
+    )
+    test_db_session.add(sqlalchemy_recording)
+    await test_db_session.commit()
+    await test_db_session.refresh(sqlalchemy_recording)
 
-        # Convert to Pydantic using from_orm (via from_attributes=True)
-        pydantic_recording = Recording.model_validate(sqlalchemy_recording)
+    # Convert to Pydantic using from_orm (via from_attributes=True)
+    pydantic_recording = Recording.model_validate(sqlalchemy_recording)
 
-        # Verify conversion
-        assert pydantic_recording.id == recording_id
-        assert pydantic_recording.patient_id == "patient-123"
-        assert pydantic_recording.status == RecordingStatus.PENDING
-        assert pydantic_recording.verification_results == {"confidence": 0.95}
+    # Verify conversion
+    assert pydantic_recording.id == recording_id
+    assert pydantic_recording.patient_id == "patient-123"
+    assert pydantic_recording.status == RecordingStatus.PENDING
+    assert pydantic_recording.verification_results == {"confidence": 0.95}
 
 
 @pytest.mark.asyncio  # type: ignore[untyped-decorator]
-async def test_recording_model_timestamps() -> None:
+async def test_recording_model_timestamps(test_db_session: AsyncSession) -> None:
     """Test that created_at and updated_at are set automatically."""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    async with AsyncSession(engine) as session:
-        recording = RecordingModel(
-            id=uuid4(),
-            patient_id="patient-123",
-            clinician_id="clinician-456",
-        )
-        session.add(recording)
-        await session.commit()
-        await session.refresh(recording)
-
-        assert recording.created_at is not None
-        assert recording.updated_at is not None
-        assert isinstance(recording.created_at, datetime)
-        assert isinstance(recording.updated_at, datetime)
+    recording = RecordingModel(
+        id=uuid4(),
+        patient_id="patient-123",
+        clinician_id="clinician-456",
+    )
+    test_db_session.add(recording)
+    await test_db_session.commit()
+    await test_db_session.refresh(recording)
+
+    assert recording.created_at is not None
+    assert recording.updated_at is not None
+    assert isinstance(recording.created_at, datetime)
+    assert isinstance(recording.updated_at, datetime)
@@ -1,11 +1,14 @@
 """Tests for audio upload endpoint."""
 
 import io
+from typing import Any
 
 import pytest
 from fastapi.testclient import TestClient
 
 from pwa.backend.main import app
+from pwa.backend.models.recording import Recording
+from pwa.backend.services.recording_service import RecordingService
 
 
 @pytest.fixture
@@ -66,3 +69,25 @@ def test_upload_audio_stores_local_key(client: TestClient) -> None:
     # Note: local_storage_key may not be in the response depending on RecordingResponse schema
     # This test verifies the upload succeeds
     assert get_response.status_code == 200
+
+
+def test_upload_audio_records_file_size(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the uploaded audio's size is passed to the recording service."""
+    captured: dict[str, object] = {}
+    original_create = RecordingService.create_recording
+
+    async def capture_create(self: RecordingService, **kwargs: Any) -> Recording:
+        captured.update(kwargs)
+        return await original_create(self, **kwargs)
+
+    monkeypatch.setattr(RecordingService, "create_recording", capture_create)
+    audio_content = b"fake audio data" * 10_000
+
+    response = client.post(
+        "/api/v1/recordings/upload",
+        files={"audio": ("test.wav", io.BytesIO(audio_content), "audio/wav")},
+        data={"patient_id": "patient-123", "duration_seconds": "60"},
+    )
+
+    assert response.status_code == 201
+    assert captured["audio_file_size"] == len(audio_content)
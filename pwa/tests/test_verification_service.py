@@ -19,3 +19,35 @@ def test_verify_valid_medication() -> None:
 
     assert result["passed"] is True
     assert result["score"] > 0.7
+
+
+def test_verify_flags_unknown_medication_and_bad_dosage() -> None:
+    """Test that name and dosage issues are both reported for each medication."""
+    service = VerificationService()
+    data = {
+        "medications": [
+            {"name": "Metformin", "dosage": "twice daily"},
+            {"name": "Zyxitol", "dosage": "10mg"},
+        ],
+        "confidence": 0.9,
+    }
+
+    result = service.verify(data)
+
+    assert result["issues"] == ["Invalid dosage format: twice daily", "Unknown medication: zyxitol"]
+    assert result["score"] == 0.8
+
+
+def test_verify_ignores_punctuation_and_whitespace_in_names() -> None:
+    """Test that stray punctuation and whitespace do not make known names look unknown."""
+    service = VerificationService()
+    data = {
+        "medications": [{"name": " Metformin,", "dosage": "500mg"}, {"name": "Insulin.", "dosage": "10 units"}],
+        "conditions": ["Heart failure.", " Diabetes "],
+        "confidence": 0.9,
+    }
+
+    result = service.verify(data)
+
+    assert result["issues"] == []
+    assert result["score"] == 1.0
@@ -32,19 +32,22 @@ Example Output:
 """
 
 import argparse
+import asyncio
+import gc
+import json
 import statistics
 import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
 from datetime import date, datetime
 from typing import Any
 from unittest.mock import patch
 
-from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 
 from src.api import app
 from src.models import EMRContext, PatientProfile, Result, VerificationResult
 
-client = TestClient(app)
-
 # Sample data
 SAMPLE_PATIENT = PatientProfile(
     patient_id="BENCH001",
@@ -66,6 +69,29 @@ Patient came in yesterday with chest pain. Started on Lisinopril 10mg daily.
 Follow up in two weeks. Blood pressure was elevated at 150/90.
 """
 
+# Request bodies are encoded once per benchmark so client-side serialization stays out of the timed region
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """Collect garbage up front and keep the collector off while timing, as timeit does."""
+    gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+def async_returning(value: Any) -> Callable[..., Awaitable[Any]]:
+    """Build a plain coroutine stub, avoiding mock call recording inside the timed loops."""
+
+    async def stub(*args: Any, **kwargs: Any) -> Any:
+        return value
+
+    return stub
+
 
 def calculate_percentiles(latencies: list[float]) -> dict[str, float]:
     """Calculate p50, p95, p99 percentiles from latency list."""
@@ -87,21 +113,22 @@ def calculate_percentiles(latencies: list[float]) -> dict[str, float]:
     }
 
 
-def benchmark_health(iterations: int) -> dict[str, float]:
+async def benchmark_health(client: AsyncClient, iterations: int) -> dict[str, float]:
     """Benchmark the /health endpoint."""
     latencies = []
 
-    for _ in range(iterations):
-        start = time.perf_counter()
-        response = client.get("/health")
-        end = time.perf_counter()
-        assert response.status_code == 200
-        latencies.append((end - start) * 1000)  # Convert to ms
+    with gc_paused():
+        for _ in range(iterations):
+            start = time.perf_counter()
+            response = await client.get("/health")
+            end = time.perf_counter()
+            assert response.status_code == 200
+            latencies.append((end - start) * 1000)  # Convert to ms
 
     return calculate_percentiles(latencies)
 
 
-def benchmark_verify_manual(iterations: int) -> dict[str, float]:
+async def benchmark_verify_manual(client: AsyncClient, iterations: int) -> dict[str, float]:
     """Benchmark the /verify endpoint (manual)."""
     latencies = []
     payload = {
@@ -123,18 +150,20 @@ def benchmark_verify_manual(iterations: int) -> dict[str, float]:
             "extracted_dates": ["2024-02-01"],
         },
     }
+    body = json.dumps(payload).encode()
 
-    for _ in range(iterations):
-        start = time.perf_counter()
-        response = client.post("/verify", json=payload)
-        end = time.perf_counter()
-        assert response.status_code == 200
-        latencies.append((end - start) * 1000)
+    with gc_paused():
+        for _ in range(iterations):
+            start = time.perf_counter()
+            response = await client.post("/verify", content=body, headers=JSON_HEADERS)
+            end = time.perf_counter()
+            assert response.status_code == 200
+            latencies.append((end - start) * 1000)
 
     return calculate_percentiles(latencies)
 
 
-def benchmark_verify_fhir(iterations: int) -> dict[str, float]:
+async def benchmark_verify_fhir(client: AsyncClient, iterations: int) -> dict[str, float]:
     """Benchmark the /verify/fhir/{id} endpoint."""
     latencies = []
     payload = {
@@ -143,17 +172,16 @@ def benchmark_verify_fhir(iterations: int) -> dict[str, float]:
             "extracted_dates": ["2024-02-22"],
         }
     }
+    body = json.dumps(payload).encode()
 
     with (
-        patch("src.api.emr_client.get_patient_profile") as mock_patient,
-        patch("src.api.emr_client.get_latest_encounter") as mock_encounter,
+        patch("src.api.emr_client.get_patient_profile", new=async_returning(SAMPLE_PATIENT)),
+        patch("src.api.emr_client.get_latest_encounter", new=async_returning(SAMPLE_CONTEXT)),
+        gc_paused(),
     ):
-        mock_patient.return_value = SAMPLE_PATIENT
-        mock_encounter.return_value = SAMPLE_CONTEXT
-
         for _ in range(iterations):
             start = time.perf_counter()
-            response = client.post("/verify/fhir/BENCH001", json=payload)
+            response = await client.post("/verify/fhir/BENCH001", content=body, headers=JSON_HEADERS)
             end = time.perf_counter()
             assert response.status_code == 200
             latencies.append((end - start) * 1000)
@@ -161,7 +189,7 @@ def benchmark_verify_fhir(iterations: int) -> dict[str, float]:
     return calculate_percentiles(latencies)
 
 
-def benchmark_extract(iterations: int) -> dict[str, float]:
+async def benchmark_extract(client: AsyncClient, iterations: int) -> dict[str, float]:
     """Benchmark the /extract endpoint."""
     from src.extraction.models import (
         ExtractedDiagnosis,
@@ -178,6 +206,7 @@ def benchmark_extract(iterations: int) -> dict[str, float]:
         "transcript": SAMPLE_TRANSCRIPT,
         "reference_date": "2024-02-22",
     }
+    body = json.dumps(payload).encode()
 
     # Create mock extraction
     mock_extraction = StructuredExtraction(
@@ -223,15 +252,13 @@ def benchmark_extract(iterations: int) -> dict[str, float]:
     )
 
     with (
-        patch("src.api.verification_workflow.verify_patient_documentation") as mock_verify,
-        patch("src.api.verification_workflow.get_last_extraction") as mock_get_extraction,
+        patch("src.api.verification_workflow.verify_patient_documentation", new=async_returning(mock_result)),
+        patch("src.api.verification_workflow.get_last_extraction", new=lambda: mock_extraction),
+        gc_paused(),
     ):
-        mock_verify.return_value = mock_result
-        mock_get_extraction.return_value = mock_extraction
-
         for _ in range(iterations):
             start = time.perf_counter()
-            response = client.post("/extract", json=payload)
+            response = await client.post("/extract", content=body, headers=JSON_HEADERS)
             end = time.perf_counter()
             assert response.status_code == 200
             latencies.append((end - start) * 1000)
@@ -247,6 +274,37 @@ def print_results(name: str, results: dict[str, float]) -> None:
     print()
 
 
+async def run_benchmarks(iterations: int, warmup: int) -> None:
+    """Run all endpoint benchmarks against the app in-process on the current event loop."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        # Warmup runs
+        if warmup > 0:
+            print(f"Running {warmup} warmup iterations...")
+            await benchmark_health(client, warmup)
+            print("Warmup complete.")
+            print()
+
+        # Run benchmarks
+        print("Results:")
+        print()
+
+        print("  [1/4] Benchmarking /health endpoint...")
+        health_results = await benchmark_health(client, iterations)
+        print_results("/health", health_results)
+
+        print("  [2/4] Benchmarking /verify (manual) endpoint...")
+        verify_results = await benchmark_verify_manual(client, iterations)
+        print_results("/verify (manual)", verify_results)
+
+        print("  [3/4] Benchmarking /verify/fhir/{id} endpoint...")
+        fhir_results = await benchmark_verify_fhir(client, iterations)
+        print_results("/verify/fhir/{id}", fhir_results)
+
+        print("  [4/4] Benchmarking /extract endpoint...")
+        extract_results = await benchmark_extract(client, iterations)
+        print_results("/extract", extract_results)
+
+
 def main() -> None:
     """Run performance benchmarks."""
     parser = argparse.ArgumentParser(description="Benchmark Clinical Guardrails API performance")
@@ -263,32 +321,7 @@ def main() -> None:
     print(f"  Warmup runs: {args.warmup}")
     print()
 
-    # Warmup runs
-    if args.warmup > 0:
-        print(f"Running {args.warmup} warmup iterations...")
-        benchmark_health(args.warmup)
-        print("Warmup complete.")
-        print()
-
-    # Run benchmarks
-    print("Results:")
-    print()
-
-    print("  [1/4] Benchmarking /health endpoint...")
-    health_results = benchmark_health(args.iterations)
-    print_results("/health", health_results)
-
-    print("  [2/4] Benchmarking /verify (manual) endpoint...")
-    verify_results = benchmark_verify_manual(args.iterations)
-    print_results("/verify (manual)", verify_results)
-
-    print("  [3/4] Benchmarking /verify/fhir/{id} endpoint...")
-    fhir_results = benchmark_verify_fhir(args.iterations)
-    print_results("/verify/fhir/{id}", fhir_results)
-
-    print("  [4/4] Benchmarking /extract endpoint...")
-    extract_results = benchmark_extract(args.iterations)
-    print_results("/extract", extract_results)
+    asyncio.run(run_benchmarks(args.iterations, args.warmup))
 
     print("=" * 60)
     print("Benchmark complete")
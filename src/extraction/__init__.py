@@ -3,20 +3,9 @@
 Converts clinician dictation into structured clinical data using LLM-based parsing.
 """
 
-from src.extraction.llm_client import (
-    DEFAULT_LLM_MAX_TOKENS,
-    DEFAULT_LLM_TEMPERATURE,
-    DEFAULT_LLM_TIMEOUT_SECONDS,
-    LLM_RETRY_INITIAL_WAIT_SECONDS,
-    LLM_RETRY_MAX_ATTEMPTS,
-    LLM_RETRY_MAX_WAIT_SECONDS,
-    AzureOpenAILLMClient,
-    LLMClient,
-    OpenAILLMClient,
-    SyntheticLLMClient,
-    create_llm_client,
-)
-from src.extraction.llm_parser import LLMTranscriptParser
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from src.extraction.models import (
     ExtractedDiagnosis,
     ExtractedMedication,
@@ -28,6 +17,52 @@ from src.extraction.models import (
 )
 from src.extraction.temporal import TemporalResolver
 
+if TYPE_CHECKING:
+    from src.extraction.cache import CachingLLMClient
+    from src.extraction.llm_client import (
+        DEFAULT_LLM_MAX_TOKENS,
+        DEFAULT_LLM_TEMPERATURE,
+        DEFAULT_LLM_TIMEOUT_SECONDS,
+        LLM_RETRY_INITIAL_WAIT_SECONDS,
+        LLM_RETRY_MAX_ATTEMPTS,
+        LLM_RETRY_MAX_WAIT_SECONDS,
+        AzureOpenAILLMClient,
+        LLMClient,
+        OpenAILLMClient,
+        SyntheticLLMClient,
+        create_llm_client,
+    )
+    from src.extraction.llm_parser import LLMTranscriptParser
+
+# The LLM clients import the openai SDK, which takes longer to import than everything
+# else here combined. They are loaded on first attribute access (PEP 562) so that code
+# needing only the data models (src.models, cli/protocols.py) does not pay for it.
+_LAZY_ATTRIBUTES = {
+    "DEFAULT_LLM_MAX_TOKENS": "src.extraction.llm_client",
+    "DEFAULT_LLM_TEMPERATURE": "src.extraction.llm_client",
+    "DEFAULT_LLM_TIMEOUT_SECONDS": "src.extraction.llm_client",
+    "LLM_RETRY_INITIAL_WAIT_SECONDS": "src.extraction.llm_client",
+    "LLM_RETRY_MAX_ATTEMPTS": "src.extraction.llm_client",
+    "LLM_RETRY_MAX_WAIT_SECONDS": "src.extraction.llm_client",
+    "AzureOpenAILLMClient": "src.extraction.llm_client",
+    "LLMClient": "src.extraction.llm_client",
+    "OpenAILLMClient": "src.extraction.llm_client",
+    "SyntheticLLMClient": "src.extraction.llm_client",
+    "create_llm_client": "src.extraction.llm_client",
+    "LLMTranscriptParser": "src.extraction.llm_parser",
+    "CachingLLMClient": "src.extraction.cache",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     # Configuration constants
     "DEFAULT_LLM_MAX_TOKENS",
@@ -51,5 +86,6 @@ __all__ = [
     "AzureOpenAILLMClient",
     "SyntheticLLMClient",
     "create_llm_client",
+    "CachingLLMClient",
     "TemporalResolver",
 ]
@@ -0,0 +1,79 @@
+"""On-disk cache of raw LLM completions for repeated development runs.
+
+Accuracy runs over the sample transcripts send the same prompts again and again
+while the parsing and comparison code is being changed. CachingLLMClient wraps
+any LLMClient and stores each completion under a SHA-256 of the model, the
+sampling parameters and the full prompt. The prompt already embeds the
+extraction template, transcript and reference date, so changing any of them
+misses the cache.
+
+Only exact matches are served. Clinical transcripts that are nearly identical
+can differ in a negation or a dose, so there is deliberately no similarity lookup.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+from src.extraction.llm_client import (
+    DEFAULT_LLM_MAX_TOKENS,
+    DEFAULT_LLM_TEMPERATURE,
+    DEFAULT_LLM_TIMEOUT_SECONDS,
+    LLMClient,
+)
+
+DEFAULT_CACHE_DIR = Path(".cache") / "extraction"
+
+
+class CachingLLMClient(LLMClient):
+    """LLMClient decorator that replays stored completions for identical requests.
+
+    Example:
+        >>> async with CachingLLMClient(create_llm_client("synthetic"), model="kimi") as client:
+        ...     response = await client.complete(prompt)
+    """
+
+    def __init__(self, client: LLMClient, model: str, cache_dir: Path = DEFAULT_CACHE_DIR) -> None:
+        """Initialize caching client.
+
+        Args:
+            client: Client that serves cache misses. Closed when this client is closed.
+            model: Provider and model identifier, part of every cache key.
+            cache_dir: Directory holding one file per cached completion.
+        """
+        self.client = client
+        self.model = model
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    def _cache_path(self, prompt: str, temperature: float, max_tokens: int) -> Path:
+        key = hashlib.sha256(f"{self.model}|{temperature}|{max_tokens}|{prompt}".encode()).hexdigest()
+        return self.cache_dir / f"{key}.txt"
+
+    async def complete(
+        self,
+        prompt: str,
+        temperature: float = DEFAULT_LLM_TEMPERATURE,
+        max_tokens: int = DEFAULT_LLM_MAX_TOKENS,
+        timeout: float = DEFAULT_LLM_TIMEOUT_SECONDS,
+    ) -> str:
+        """Return the stored completion for this request, calling the wrapped client on a miss."""
+        path = self._cache_path(prompt, temperature, max_tokens)
+        if path.exists():
+            self.hits += 1
+            return path.read_text(encoding="utf-8")
+
+        response = await self.client.complete(prompt, temperature=temperature, max_tokens=max_tokens, timeout=timeout)
+        self.misses += 1
+
+        # Write then rename so an interrupted run never leaves a truncated entry behind
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(response, encoding="utf-8")
+        tmp_path.replace(path)
+        return response
+
+    async def close(self) -> None:
+        """Close the wrapped client."""
+        await self.client.close()
@@ -7,6 +7,7 @@ This module provides the end-to-end workflow that:
 4. Returns verification result with alerts
 """
 
+import asyncio
 from datetime import date
 from typing import TYPE_CHECKING
 
@@ -25,8 +26,12 @@ from src.models import (
 from .client import FHIRClient
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from src.extraction.models import StructuredExtraction
 
+DEFAULT_BATCH_CONCURRENCY = 4
+
 
 class VerificationWorkflowError(Exception):
     """Base error for verification workflow failures."""
@@ -91,13 +96,30 @@ class VerificationWorkflow:
         Returns:
             Result containing either VerificationResult or list of ComplianceAlerts
         """
+        result, extraction = await self._verify(patient_id, transcript, reference_date)
+        if extraction is not None:
+            self._last_extraction = extraction  # Store for later retrieval
+        return result
+
+    async def _verify(
+        self,
+        patient_id: str,
+        transcript: str,
+        reference_date: date | None = None,
+    ) -> tuple[Result[VerificationResult, list[ComplianceAlert]], "StructuredExtraction | None"]:
+        """Run the verification workflow without touching ``_last_extraction``.
+
+        Returns:
+            Tuple of (Result, extraction), where extraction is None if the
+            workflow failed before extraction completed
+        """
+        extraction: StructuredExtraction | None = None
         try:
             # Step 1: Fetch EMR context from FHIR
             patient, emr_context = await self._fetch_patient_context(patient_id)
 
             # Step 2: Extract structured data from transcript
             extraction = await self._extract_transcript(transcript, reference_date)
-            self._last_extraction = extraction  # Store for later retrieval
 
             # Step 3: Convert extraction to AI output format
             ai_output = self._convert_to_ai_output(extraction, transcript)
@@ -105,7 +127,7 @@ class VerificationWorkflow:
             # Step 4: Verify against EMR context
             result = self.compliance_engine.verify(patient, emr_context, ai_output)
 
-            return result
+            return result, extraction
 
         except PatientNotFoundError:
             return Result.failure(
@@ -117,7 +139,7 @@ class VerificationWorkflow:
                         field="patient_id",
                     )
                 ]
-            )
+            ), extraction
         except ExtractionError as e:
             return Result.failure(
                 error=[
@@ -128,7 +150,7 @@ class VerificationWorkflow:
                         field="transcript",
                     )
                 ]
-            )
+            ), extraction
         except Exception as e:
             return Result.failure(
                 error=[
@@ -139,7 +161,41 @@ class VerificationWorkflow:
                         field="workflow",
                     )
                 ]
-            )
+            ), extraction
+
+    async def verify_patients_batch(
+        self,
+        items: "Sequence[tuple[str, str]]",
+        reference_date: date | None = None,
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[Result[VerificationResult, list[ComplianceAlert]]]:
+        """Verify documentation for several patients concurrently.
+
+        The whole batch shares one reference date, which is applied to the
+        parser once up front so concurrent extractions cannot race on it.
+        Batch items do not update ``get_last_extraction()``, since "last" has
+        no meaning for calls that finish in arbitrary order.
+
+        Args:
+            items: (patient_id, transcript) pairs to verify
+            reference_date: Optional reference date for temporal resolution
+            concurrency: Maximum number of patients processed at once
+
+        Returns:
+            One Result per item, in input order
+        """
+        if reference_date:
+            self._set_reference_date(reference_date)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def verify_one(patient_id: str, transcript: str) -> Result[VerificationResult, list[ComplianceAlert]]:
+            async with semaphore:
+                result, _ = await self._verify(patient_id, transcript)
+                return result
+
+        return await asyncio.gather(*(verify_one(patient_id, transcript) for patient_id, transcript in items))
 
     async def _fetch_patient_context(self, patient_id: str) -> tuple[PatientProfile, EMRContext]:
         """Fetch patient profile and latest encounter from FHIR.
@@ -178,15 +234,19 @@ class VerificationWorkflow:
         try:
             # Update parser reference date if provided
             if reference_date:
-                from src.extraction.temporal import TemporalResolver
-
-                self.llm_parser.temporal_resolver = TemporalResolver(reference_date)
+                self._set_reference_date(reference_date)
 
             extraction = await self.llm_parser.parse(transcript)
             return extraction
         except Exception as e:
             raise ExtractionError(f"Transcript extraction failed: {e}") from e
 
+    def _set_reference_date(self, reference_date: date) -> None:
+        """Point the parser's temporal resolver at a new reference date."""
+        from src.extraction.temporal import TemporalResolver
+
+        self.llm_parser.temporal_resolver = TemporalResolver(reference_date)
+
     def _convert_to_ai_output(self, extraction: "StructuredExtraction", transcript: str) -> AIGeneratedOutput:
         """Convert extraction to AIGeneratedOutput format.
 
@@ -229,7 +289,9 @@ class VerificationWorkflow:
         )
 
     def get_last_extraction(self) -> "StructuredExtraction | None":
-        """Get the last extraction performed by this workflow.
+        """Get the last extraction performed by ``verify_patient_documentation``.
+
+        Extractions made by ``verify_patients_batch`` are not recorded here.
 
         Returns:
             StructuredExtraction if available, None otherwise
@@ -239,3 +301,11 @@ class VerificationWorkflow:
     async def close(self) -> None:
         """Clean up resources."""
         await self.fhir_client.close()
+
+    async def __aenter__(self) -> "VerificationWorkflow":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Async context manager exit."""
+        await self.close()
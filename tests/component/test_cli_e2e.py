@@ -112,3 +112,17 @@ class TestCLIExtractE2E:
             assert "confidence" in data
         finally:
             Path(output_path).unlink(missing_ok=True)
+
+    def test_test_batch_rejects_out_of_range_index(self) -> None:
+        """E2E: test-batch should reject indices outside the sample list before calling the API."""
+        result = runner.invoke(app, ["test-batch", "--indices", "0,999"])
+
+        assert result.exit_code == 1
+        assert "Invalid index" in result.output
+
+    def test_test_batch_rejects_non_numeric_indices(self) -> None:
+        """E2E: test-batch should reject indices that are not integers."""
+        result = runner.invoke(app, ["test-batch", "--indices", "0,abc"])
+
+        assert result.exit_code == 1
+        assert "Invalid indices" in result.output
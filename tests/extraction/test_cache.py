@@ -0,0 +1,75 @@
+"""Tests for the on-disk LLM response cache."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.extraction.cache import CachingLLMClient
+from src.extraction.llm_client import LLMClient
+
+
+class CountingLLMClient(LLMClient):
+    """Fake client that echoes the prompt and counts calls."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.closed = False
+
+    async def complete(self, prompt: str, **kwargs: Any) -> str:
+        self.calls += 1
+        return f'{{"echo": "{prompt}", "call": {self.calls}}}'
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_repeated_prompt_is_served_from_disk(tmp_path: Path) -> None:
+    """The second identical request should not reach the wrapped client."""
+    inner = CountingLLMClient()
+    client = CachingLLMClient(inner, model="synthetic:test", cache_dir=tmp_path)
+
+    first = await client.complete("Patient has fever")
+    second = await client.complete("Patient has fever")
+
+    assert first == second
+    assert inner.calls == 1
+    assert (client.hits, client.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_cache_survives_new_client_instance(tmp_path: Path) -> None:
+    """Entries persist on disk, so a later run replays them."""
+    await CachingLLMClient(CountingLLMClient(), model="m", cache_dir=tmp_path).complete("prompt")
+
+    inner = CountingLLMClient()
+    response = await CachingLLMClient(inner, model="m", cache_dir=tmp_path).complete("prompt")
+
+    assert inner.calls == 0
+    assert '"call": 1' in response
+
+
+@pytest.mark.asyncio
+async def test_prompt_model_and_parameters_are_part_of_the_key(tmp_path: Path) -> None:
+    """Any change to prompt, model or sampling parameters is a cache miss."""
+    inner = CountingLLMClient()
+    client = CachingLLMClient(inner, model="m1", cache_dir=tmp_path)
+
+    await client.complete("prompt")
+    await client.complete("prompt ")
+    await client.complete("prompt", temperature=0.9)
+    await CachingLLMClient(inner, model="m2", cache_dir=tmp_path).complete("prompt")
+
+    assert inner.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_close_closes_wrapped_client(tmp_path: Path) -> None:
+    """Closing the cache closes the client it wraps."""
+    inner = CountingLLMClient()
+
+    async with CachingLLMClient(inner, model="m", cache_dir=tmp_path):
+        pass
+
+    assert inner.closed
@@ -0,0 +1,25 @@
+"""Tests for the src.extraction package's lazy exports."""
+
+import subprocess
+import sys
+
+import src.extraction
+
+
+def test_models_import_does_not_load_openai_sdk() -> None:
+    """Importing the data models (as src.models does) should not import the openai SDK."""
+    code = "import sys, src.models; assert 'openai' not in sys.modules, 'openai was imported'"
+
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=False)
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_lazy_exports_resolve_to_llm_modules() -> None:
+    """Names in __all__ should still be importable from the package."""
+    from src.extraction.llm_client import SyntheticLLMClient
+    from src.extraction.llm_parser import LLMTranscriptParser
+
+    assert src.extraction.SyntheticLLMClient is SyntheticLLMClient
+    assert src.extraction.LLMTranscriptParser is LLMTranscriptParser
+    assert all(hasattr(src.extraction, name) for name in src.extraction.__all__)
@@ -0,0 +1,58 @@
+"""Tests for the medical protocols CLI."""
+
+import argparse
+
+import pytest
+
+from cli.protocols import check_transcript
+
+
+def test_check_runs_each_comma_separated_patient(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that check evaluates every patient in a comma-separated --patient-id."""
+    args = argparse.Namespace(
+        config="config/medical_protocols.yaml",
+        patient_id="P1, P2",
+        allergies="penicillin",
+        medications="amoxicillin",
+    )
+
+    check_transcript(args)
+
+    output = capsys.readouterr().out
+    assert "Checking patient: P1" in output
+    assert "Checking patient: P2" in output
+    assert output.count("protocol violation(s) detected") == 2
+
+
+def test_check_defaults_to_single_cli_patient(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that check without --patient-id runs once for the placeholder patient."""
+    args = argparse.Namespace(
+        config="config/medical_protocols.yaml",
+        patient_id=None,
+        allergies=None,
+        medications=None,
+    )
+
+    check_transcript(args)
+
+    output = capsys.readouterr().out
+    assert output.count("Checking patient:") == 1
+    assert "Checking patient: CLI-PATIENT" in output
+    assert "No protocol violations detected" in output
+
+
+def test_check_trims_whitespace_around_list_items(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that "a, b" style lists match rules the same as "a,b"."""
+    args = argparse.Namespace(
+        config="config/medical_protocols.yaml",
+        patient_id=None,
+        allergies="sulfa, penicillin",
+        medications=" amoxicillin , ",
+    )
+
+    check_transcript(args)
+
+    output = capsys.readouterr().out
+    assert "Allergies: ['sulfa', 'penicillin']" in output
+    assert "Medications: ['amoxicillin']" in output
+    assert "protocol violation(s) detected" in output
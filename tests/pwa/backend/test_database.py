@@ -1,24 +1,37 @@
 """Tests for database module."""
 
+from collections.abc import AsyncGenerator
 from pathlib import Path
 
 import pytest
-from sqlalchemy import text
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
-from pwa.backend.database import close_db, engine, get_db, init_db
+from pwa.backend import database
+from pwa.backend.database import close_db, get_db, init_db
 
 
-@pytest.fixture(autouse=True, scope="module")
-def ensure_data_dir():
-    """Ensure data directory exists for database tests."""
-    data_dir = Path("./data")
-    data_dir.mkdir(parents=True, exist_ok=True)
-    yield
-    # Cleanup is not needed - directory can remain
+@pytest_asyncio.fixture(autouse=True)
+async def engine(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> AsyncGenerator[AsyncEngine, None]:
+    """Point the database module at a file in tmp_path instead of ./data/clinical.db.
+
+    WAL mode needs a file-backed database, so the shared in-memory engine will not do.
+    """
+    tmp_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'clinical.db'}", echo=False, future=True)
+    event.listen(tmp_engine.sync_engine, "connect", database.set_sqlite_pragma)
+    monkeypatch.setattr(database, "engine", tmp_engine)
+    monkeypatch.setattr(
+        database,
+        "AsyncSessionLocal",
+        async_sessionmaker(tmp_engine, class_=AsyncSession, expire_on_commit=False, autoflush=False),
+    )
+    yield tmp_engine
+    await tmp_engine.dispose()
 
 
 @pytest.mark.asyncio
-async def test_database_connection():
+async def test_database_connection(engine):
     """Test that database connection works with PRAGMA settings."""
     async with engine.connect() as conn:
         # Test PRAGMA settings
@@ -38,6 +51,14 @@ async def test_database_connection():
         busy_timeout = result.scalar()
         assert busy_timeout == 5000, f"Expected busy_timeout=5000, got {busy_timeout}"
 
+        result = await conn.execute(text("PRAGMA cache_size"))
+        cache_size = result.scalar()
+        assert cache_size == -65536, f"Expected cache_size=-65536 (64 MiB), got {cache_size}"
+
+        result = await conn.execute(text("PRAGMA temp_store"))
+        temp_store = result.scalar()
+        assert temp_store == 2, f"Expected temp_store=MEMORY (2), got {temp_store}"
+
 
 @pytest.mark.asyncio
 async def test_get_db_dependency():
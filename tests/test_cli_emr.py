@@ -0,0 +1,42 @@
+"""Tests for the EMR inspection CLI."""
+
+from datetime import date, datetime
+
+import pytest
+from click.testing import CliRunner
+
+import cli.emr as emr_module
+from src.models import EMRContext, PatientProfile
+
+
+class FakeFHIRClient:
+    """FHIR client stand-in whose profile lookup fails for patient "BAD"."""
+
+    async def get_patient_profile(self, patient_id: str) -> PatientProfile:
+        if patient_id == "BAD":
+            raise ValueError("Patient BAD not found")
+        return PatientProfile(patient_id=patient_id, first_name="Jane", last_name="Doe", dob=date(1980, 1, 1))
+
+    async def get_latest_encounter(self, patient_id: str) -> EMRContext:
+        return EMRContext(
+            visit_id=f"V-{patient_id}",
+            patient_id=patient_id,
+            admission_date=datetime(2024, 1, 15, 9, 0),
+            attending_physician="Dr. Smith",
+            raw_notes="",
+        )
+
+    async def close(self) -> None:
+        pass
+
+
+def test_inspect_many_reports_failed_patient_and_continues(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A failing profile fetch for one patient should not stop the others."""
+    monkeypatch.setattr(emr_module, "FHIRClient", FakeFHIRClient)
+
+    result = CliRunner().invoke(emr_module.cli, ["inspect-many", "BAD", "GOOD"])
+
+    assert result.exit_code == 0
+    assert "❌ Patient BAD: Patient BAD not found" in result.output
+    assert "Domain Profile: Jane Doe" in result.output
+    assert "Latest Visit: V-GOOD" in result.output
@@ -0,0 +1,21 @@
+"""Tests for extraction CLI display helpers."""
+
+import pytest
+
+from cli.extract import _conf_color
+
+
+@pytest.mark.parametrize(
+    ("confidence", "expected"),
+    [
+        (0.0, "red"),
+        (0.49, "red"),
+        (0.5, "yellow"),
+        (0.79, "yellow"),
+        (0.8, "green"),
+        (1.0, "green"),
+    ],
+)
+def test_conf_color_thresholds(confidence: float, expected: str) -> None:
+    """Confidence colors switch at exactly 0.5 and 0.8."""
+    assert _conf_color(confidence) == expected
@@ -0,0 +1,33 @@
+"""Tests for the extraction accuracy CLI's batch runner."""
+
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+import cli.test_extraction as test_extraction_module
+
+
+@pytest.mark.asyncio
+async def test_concurrent_run_caps_in_flight_calls_and_keeps_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Results come back in input order with no more than `concurrency` transcripts running at once."""
+    in_flight = 0
+    peak = 0
+
+    async def fake_single(transcript: dict[str, Any], *args: Any, **kwargs: Any) -> dict[str, Any]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later transcripts finish first, so completion order differs from input order
+        await asyncio.sleep(0.01 * (5 - int(transcript["id"])))
+        in_flight -= 1
+        return {"id": transcript["id"], "accuracy": 1.0, "confidence": 0.9}
+
+    monkeypatch.setattr(test_extraction_module, "test_single_transcript", fake_single)
+    transcripts = [{"id": str(i), "text": ""} for i in range(5)]
+
+    results = await test_extraction_module.test_transcripts_concurrently(transcripts, parser=MagicMock(), concurrency=2)
+
+    assert [r["id"] for r in results] == ["0", "1", "2", "3", "4"]
+    assert peak == 2
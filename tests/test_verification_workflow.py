@@ -0,0 +1,104 @@
+"""Tests for batch verification in VerificationWorkflow."""
+
+import asyncio
+from datetime import date, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.extraction.models import StructuredExtraction
+from src.extraction.temporal import TemporalResolver
+from src.integrations.fhir.workflow import VerificationWorkflow
+from src.models import EMRContext, PatientProfile
+
+
+class FakeFHIRClient:
+    """FHIR client stand-in that tracks concurrent lookups and rejects patient "BAD"."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_patient_profile(self, patient_id: str) -> PatientProfile:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if patient_id == "BAD":
+                raise ValueError(f"Patient {patient_id} not found")
+            return PatientProfile(patient_id=patient_id, first_name="Jane", last_name="Doe", dob=date(1980, 1, 1))
+        finally:
+            self.in_flight -= 1
+
+    async def get_latest_encounter(self, patient_id: str) -> EMRContext:
+        return EMRContext(
+            visit_id=f"V-{patient_id}",
+            patient_id=patient_id,
+            admission_date=datetime(2024, 1, 15, 9, 0),
+            attending_physician="Dr. Smith",
+            raw_notes="",
+        )
+
+
+class FakeParser:
+    """Parser stand-in that returns an empty extraction."""
+
+    def __init__(self) -> None:
+        self.temporal_resolver = TemporalResolver(date(2000, 1, 1))
+
+    async def parse(self, text: str) -> StructuredExtraction:
+        return StructuredExtraction()
+
+
+@pytest.mark.asyncio
+async def test_verify_patients_batch_limits_concurrency_and_keeps_order() -> None:
+    """The batch should respect the concurrency cap and return results in input order."""
+    fhir_client = FakeFHIRClient()
+    parser = FakeParser()
+    workflow = VerificationWorkflow(fhir_client=fhir_client, llm_parser=parser)  # type: ignore[arg-type]
+    items = [(f"P{i}", "Patient seen today.") for i in range(5)] + [("BAD", "Patient seen today.")]
+
+    results = await workflow.verify_patients_batch(items, reference_date=date(2024, 1, 16), concurrency=2)
+
+    assert fhir_client.max_in_flight == 2
+    assert [r.is_success for r in results] == [True] * 5 + [False]
+    assert results[-1].error is not None
+    assert results[-1].error[0].rule_id == "FHIR_PATIENT_NOT_FOUND"
+    assert parser.temporal_resolver.reference_date == date(2024, 1, 16)
+
+
+@pytest.mark.asyncio
+async def test_verify_patients_batch_empty() -> None:
+    """An empty batch should return an empty list."""
+    workflow = VerificationWorkflow(fhir_client=MagicMock(), llm_parser=MagicMock())
+
+    assert await workflow.verify_patients_batch([]) == []
+
+
+@pytest.mark.asyncio
+async def test_verify_patients_batch_leaves_last_extraction_alone() -> None:
+    """Batch items should not overwrite the extraction from the last single verification."""
+    parser = FakeParser()
+    parser.parse = AsyncMock(side_effect=lambda text: StructuredExtraction(patient_name=text))  # type: ignore[method-assign]
+    workflow = VerificationWorkflow(fhir_client=FakeFHIRClient(), llm_parser=parser)  # type: ignore[arg-type]
+
+    await workflow.verify_patients_batch([("P1", "first"), ("P2", "second")])
+    assert workflow.get_last_extraction() is None
+
+    await workflow.verify_patient_documentation("P0", "single")
+    await workflow.verify_patients_batch([("P1", "first"), ("P2", "second")])
+    last = workflow.get_last_extraction()
+    assert last is not None
+    assert last.patient_name == "single"
+
+
+@pytest.mark.asyncio
+async def test_async_context_manager_closes_fhir_client() -> None:
+    """Leaving an ``async with`` block should close the workflow's FHIR client."""
+    fhir_client = MagicMock()
+    fhir_client.close = AsyncMock()
+
+    async with VerificationWorkflow(fhir_client=fhir_client, llm_parser=MagicMock()) as workflow:
+        assert workflow.fhir_client is fhir_client
+
+    fhir_client.close.assert_awaited_once()